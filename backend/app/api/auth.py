@@ -2,20 +2,27 @@
 Auth API - PIN-based authentication with JWT tokens.
 """
 
+import hmac
 import os
-from datetime import datetime, timedelta
+import time
 from typing import List
 
 import jwt
 from fastapi import APIRouter, HTTPException, Form
 from pydantic import BaseModel
 
+from app.util.auth import decode_token, encode_token
+
 router = APIRouter()
 
-# JWT Configuration
-SECRET_KEY = os.getenv("JWT_SECRET", "dev-secret-change-in-production")
-ALGORITHM = "HS256"
 MIRA_PIN = os.getenv("MIRA_PIN", "1234")
+TOKEN_LIFETIME = 24 * 60 * 60  # seconds
+
+# Encoded once for constant-time PIN comparison
+_PIN_BYTES = MIRA_PIN.encode()
+
+# Capabilities granted on PIN login
+_CAPS = ("mic.toggle", "cam.toggle", "mode.switch", "command.send")
 
 
 class TokenResponse(BaseModel):
@@ -33,24 +40,25 @@ async def pin_login(pin: str = Form(...)):
 
     Default PIN: 1234 (set via MIRA_PIN environment variable)
     """
-    if pin != MIRA_PIN:
+    if not hmac.compare_digest(pin.encode(), _PIN_BYTES):
         raise HTTPException(
             status_code=401,
             detail="Invalid PIN",
         )
 
     # Create JWT with capabilities
+    now = int(time.time())
     payload = {
-        "cap": ["mic.toggle", "cam.toggle", "mode.switch", "command.send"],
-        "exp": datetime.utcnow() + timedelta(hours=24),
-        "iat": datetime.utcnow(),
+        "cap": _CAPS,
+        "exp": now + TOKEN_LIFETIME,
+        "iat": now,
     }
 
-    token = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+    token = encode_token(payload)
 
     return TokenResponse(
         token=token,
-        capabilities=payload["cap"],
+        capabilities=list(_CAPS),
     )
 
 
@@ -60,7 +68,7 @@ async def verify_token(token: str = Form(...)):
     Verify a JWT token and return its capabilities.
     """
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_token(token)
         return {
             "valid": True,
             "capabilities": payload.get("cap", []),
@@ -10,20 +10,18 @@ BEFORE using this:
 3. Update frontend to send JWT tokens in Authorization header
 """
 
-import os
-import json
-import aiosqlite
+import logging
 from typing import Any, Dict, Optional
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Response
 import httpx
 
 from app.models.app_wide import Command
 from app.util.auth import require_capability, optional_auth, TokenData
+from app.util.control_plane_db import fetch_latest_state_json
+from app.util.http_clients import JSON_HEADERS, get_control_plane_client
 
 router = APIRouter()
-
-CONTROL_PLANE_URL = os.getenv("CONTROL_PLANE_URL", "http://localhost:8090")
-DB_PATH = os.getenv("CONTROL_PLANE_DB", "/app/data/control_plane.db")
+logger = logging.getLogger(__name__)
 
 
 @router.post("/api/v1/command")
@@ -44,17 +42,15 @@ async def send_command(
     The Control Plane will process it and broadcast state patches via Redis.
     """
     # Log who sent the command (useful for audit)
-    print(f"Command from authenticated user with caps: {token.capabilities}")
+    logger.debug("Command from authenticated user with caps=%s", token.capabilities)
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{CONTROL_PLANE_URL}/command",
-                json=cmd.dict(),
-                timeout=5.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_control_plane_client()
+        response = await client.post(
+            "/command", content=cmd.model_dump_json(), headers=JSON_HEADERS
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError as e:
         raise HTTPException(
             status_code=503,
@@ -73,21 +69,18 @@ async def get_state() -> Dict[str, Any]:
     Returns the most recent snapshot or an empty state if none exists.
     """
     try:
-        async with aiosqlite.connect(DB_PATH) as db:
-            cursor = await db.execute(
-                "SELECT state FROM snapshots ORDER BY id DESC LIMIT 1"
-            )
-            row = await cursor.fetchone()
-
-            if row:
-                return json.loads(row[0])
-            else:
-                # Return empty state if no snapshots exist yet
-                return {
-                    "mode": "ambient",
-                    "todos": [],
-                    "gesture": "idle",
-                }
+        snapshot = await fetch_latest_state_json()
+
+        if snapshot is not None:
+            # Already JSON - send the stored bytes without re-serializing
+            return Response(content=snapshot, media_type="application/json")
+        else:
+            # Return empty state if no snapshots exist yet
+            return {
+                "mode": "ambient",
+                "todos": [],
+                "gesture": "idle",
+            }
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -1,16 +1,30 @@
+import time
 from datetime import datetime, timezone
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
+# Health checks are polled frequently (load balancers, Docker), so the
+# serialized body is reused for a short window instead of rebuilt per request.
+HEALTH_CACHE_TTL = 0.1
+_health_cache = (float("-inf"), b"")
+
 
 @router.get("/health")
 async def health_check():
     """Health check endpoint that returns server status."""
-    return {
-        "status": "ok",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "service": "mira-backend",
-        "version": "1.0.0",
-    }
+    global _health_cache
+    now = time.monotonic()
+    if now - _health_cache[0] >= HEALTH_CACHE_TTL:
+        body = orjson.dumps(
+            {
+                "status": "ok",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "service": "mira-backend",
+                "version": "1.0.0",
+            }
+        )
+        _health_cache = (now, body)
+    return Response(content=_health_cache[1], media_type="application/json")
@@ -1,6 +1,16 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
 from fastapi import APIRouter, Depends
 
-from app.models.morning_report import MorningReport
+from app.models.morning_report import (
+    CalendarItem,
+    MorningReport,
+    NewsItem,
+    WeatherSnapshot,
+)
 from app.providers.calendar import get_calendar_items
 from app.providers.news import get_news_items
 from app.providers.weather import get_weather_snapshot
@@ -9,39 +19,65 @@ from app.util.auth import require_capability, TokenData
 
 router = APIRouter()
 
+ProviderData = Tuple[List[CalendarItem], WeatherSnapshot, List[NewsItem]]
+
+# Calendar, weather and news are coarse-grained, so polls within the TTL share
+# one provider fetch. Todos are always read fresh.
+PROVIDER_CACHE_TTL = 30.0
+_provider_cache: Optional[Tuple[float, ProviderData]] = None
+
+
+def _fallback_weather() -> WeatherSnapshot:
+    """Placeholder weather used when the provider fails."""
+    return WeatherSnapshot(
+        updatedISO=datetime.now(timezone.utc).isoformat(),
+        tempC=20.0,
+        condition="unknown",
+        icon="❓",
+        stale=True,
+    )
+
+
+def _get_provider_data() -> ProviderData:
+    """
+    Fetch calendar, weather and news.
+    The providers are cached, in-memory and CPU-only, so they are called
+    inline; a thread hop per provider would cost more than the call.
+    A failing provider is replaced by empty/stale data rather than failing the
+    whole report; results are only cached when every provider succeeded.
+    """
+    global _provider_cache
+    now = time.monotonic()
+    if _provider_cache is not None and now - _provider_cache[0] < PROVIDER_CACHE_TTL:
+        return _provider_cache[1]
+
+    failed = False
+    try:
+        calendar = get_calendar_items(10)
+    except Exception:
+        calendar, failed = [], True
+    try:
+        weather = get_weather_snapshot()
+    except Exception:
+        weather, failed = _fallback_weather(), True
+    try:
+        news = get_news_items(5)
+    except Exception:
+        news, failed = [], True
+
+    data = (calendar, weather, news)
+    if not failed:
+        _provider_cache = (now, data)
+    return data
+
 
 @router.get("/api/v1/morning-report", response_model=MorningReport)
 async def get_morning_report(
     token: TokenData = Depends(require_capability("command.send")),
 ):
     """Get the morning report aggregating all data sources. Requires 'command.send' capability."""
-    try:
-        # Fetch data from all providers
-        calendar = get_calendar_items(limit=10)
-        weather = get_weather_snapshot()
-        news = get_news_items(limit=5)
-        todos = get_all_todos()
-
-        return MorningReport(calendar=calendar, weather=weather, news=news, todos=todos)
-    except Exception as e:
-        # In case of any errors, return empty data rather than failing completely
-        from app.models.morning_report import (
-            CalendarItem,
-            NewsItem,
-            Todo,
-            WeatherSnapshot,
-        )
-        from datetime import datetime, timezone
-
-        return MorningReport(
-            calendar=[],
-            weather=WeatherSnapshot(
-                updatedISO=datetime.now(timezone.utc).isoformat(),
-                tempC=20.0,
-                condition="unknown",
-                icon="❓",
-                stale=True,
-            ),
-            news=[],
-            todos=[],
-        )
+    calendar, weather, news = _get_provider_data()
+    # Todos come from the data file, so that read stays off the event loop
+    todos = await asyncio.to_thread(get_all_todos)
+
+    return MorningReport(calendar=calendar, weather=weather, news=news, todos=todos)
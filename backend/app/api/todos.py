@@ -1,16 +1,34 @@
+import asyncio
 import uuid
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
 
 from app.models.morning_report import Todo
-from app.util.storage import read_json, write_json
+from app.util.storage import aread_json, aread_json_indexed, awrite_json, read_json
 from app.util.auth import require_capability, TokenData
 
 router = APIRouter()
 
+# Validates a whole list of stored todos in one call
+_TODO_LIST = TypeAdapter(List[Todo])
+
+
+def _json(content: Union[bytes, str]) -> Response:
+    """
+    Wrap already-serialized JSON; skips FastAPI's re-validation and
+    jsonable_encoder pass (response_model still documents the schema)
+    """
+    return Response(content=content, media_type="application/json")
+
+
+# Serializes read-modify-write cycles; file I/O runs in worker threads, so
+# concurrent mutations could otherwise interleave between read and write
+_write_lock = asyncio.Lock()
+
 
 class CreateTodoRequest(BaseModel):
     text: str
@@ -25,8 +43,8 @@ class UpdateTodoRequest(BaseModel):
 async def get_todos(token: TokenData = Depends(require_capability("command.send"))):
     """Get all todos. Requires 'command.send' capability."""
     try:
-        todos_data = read_json()
-        return [Todo(**todo) for todo in todos_data]
+        todos = _TODO_LIST.validate_python(await aread_json())
+        return _json(_TODO_LIST.dump_json(todos))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to read todos: {str(e)}")
 
@@ -38,19 +56,8 @@ async def create_todo(
 ):
     """Create a new todo. Requires 'command.send' capability."""
     try:
-        todos_data = read_json()
-
-        new_todo = Todo(
-            id=str(uuid.uuid4()),
-            text=request.text,
-            done=False,
-            createdAtISO=datetime.now(timezone.utc).isoformat(),
-        )
-
-        todos_data.append(new_todo.dict())
-        write_json(todos_data)
-
-        return new_todo
+        todo = await append_todo(request.text)
+        return _json(todo.model_dump_json())
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create todo: {str(e)}")
 
@@ -61,12 +68,12 @@ async def get_todo(
 ):
     """Get a specific todo by ID. Requires 'command.send' capability."""
     try:
-        todos_data = read_json()
-        for todo in todos_data:
-            if todo["id"] == todo_id:
-                return Todo(**todo)
+        todos_data, index = await aread_json_indexed()
+        i = index.get(todo_id)
+        if i is None:
+            raise HTTPException(status_code=404, detail="Todo not found")
 
-        raise HTTPException(status_code=404, detail="Todo not found")
+        return _json(Todo.model_validate(todos_data[i]).model_dump_json())
     except HTTPException:
         raise
     except Exception as e:
@@ -81,22 +88,21 @@ async def update_todo(
 ):
     """Update a specific todo by ID. Requires 'command.send' capability."""
     try:
-        todos_data = read_json()
-
-        for i, todo in enumerate(todos_data):
-            if todo["id"] == todo_id:
-                # Update fields if provided
-                if request.text is not None:
-                    todo["text"] = request.text
-                if request.done is not None:
-                    todo["done"] = request.done
-
-                todos_data[i] = todo
-                write_json(todos_data)
-
-                return Todo(**todo)
-
-        raise HTTPException(status_code=404, detail="Todo not found")
+        async with _write_lock:
+            todos_data, index = await aread_json_indexed()
+            i = index.get(todo_id)
+            if i is None:
+                raise HTTPException(status_code=404, detail="Todo not found")
+
+            # Build updated copies; the cached list stays untouched until
+            # the new file is in place, so readers never see unsaved edits
+            todo = {
+                **todos_data[i],
+                **request.model_dump(exclude_none=True),
+            }
+            await awrite_json([*todos_data[:i], todo, *todos_data[i + 1 :]])
+
+        return _json(Todo.model_validate(todo).model_dump_json())
     except HTTPException:
         raise
     except Exception as e:
@@ -109,15 +115,16 @@ async def delete_todo(
 ):
     """Delete a specific todo by ID. Requires 'command.send' capability."""
     try:
-        todos_data = read_json()
+        async with _write_lock:
+            todos_data, index = await aread_json_indexed()
+            i = index.get(todo_id)
+            if i is None:
+                raise HTTPException(status_code=404, detail="Todo not found")
 
-        for i, todo in enumerate(todos_data):
-            if todo["id"] == todo_id:
-                del todos_data[i]
-                write_json(todos_data)
-                return {"message": "Todo deleted successfully"}
+            # Slicing keeps creation order, which the UI lists todos in
+            await awrite_json([*todos_data[:i], *todos_data[i + 1 :]])
 
-        raise HTTPException(status_code=404, detail="Todo not found")
+        return {"message": "Todo deleted successfully"}
     except HTTPException:
         raise
     except Exception as e:
@@ -127,8 +134,23 @@ async def delete_todo(
 def get_all_todos() -> List[Todo]:
     """Helper function to get all todos for use by other modules."""
     try:
-        todos_data = read_json()
-        return [Todo(**todo) for todo in todos_data]
+        return _TODO_LIST.validate_python(read_json())
     except Exception:
         # Return empty list if there's an error reading todos
         return []
+
+
+async def append_todo(text: str) -> Todo:
+    """Create a new todo, persist it, and return it. Shared by REST and voice."""
+    new_todo = Todo(
+        id=str(uuid.uuid4()),
+        text=text,
+        done=False,
+        createdAtISO=datetime.now(timezone.utc).isoformat(),
+    )
+
+    async with _write_lock:
+        todos_data = await aread_json()
+        await awrite_json([*todos_data, new_todo.model_dump()])
+
+    return new_todo
@@ -1,75 +1,90 @@
 import base64
-import os
+import hashlib
+import logging
 from pathlib import Path
 
-import redis.asyncio as aioredis
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse, Response
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
+
+from app.util.redis import get_redis
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 # Path to static snapshot image
 STATIC_DIR = Path(__file__).parent.parent / "static"
 SNAPSHOT_PATH = STATIC_DIR / "sample.jpg"
 
-# Redis configuration
-REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+# The sample image is the common case in mock mode, so it is read once at
+# import rather than opened and stat'ed per request
+_FALLBACK_JPEG: bytes | None = (
+    SNAPSHOT_PATH.read_bytes() if SNAPSHOT_PATH.exists() else None
+)
+_FALLBACK_ETAG: str | None = (
+    f'"sample-{hashlib.blake2b(_FALLBACK_JPEG, digest_size=16).hexdigest()}"'
+    if _FALLBACK_JPEG is not None
+    else None
+)
+
+# Redis keys
 SNAPSHOT_KEY = "mira:vision:snapshot"
+SNAPSHOT_VERSION_KEY = "mira:vision:snapshot:version"
+
+# Snapshots are stored as raw JPEG; anything else was written by an older
+# gesture worker as base64
+_JPEG_MAGIC = b"\xff\xd8"
 
-# Redis client (lazy initialization)
-_redis_client: aioredis.Redis | None = None
 
+def _fallback_response(request: Request) -> Response:
+    """Serve the in-memory sample image, honouring If-None-Match"""
+    if _FALLBACK_JPEG is None:
+        raise HTTPException(status_code=404, detail="Snapshot image not found")
 
-async def get_redis_client() -> aioredis.Redis:
-    """Get or create Redis client"""
-    global _redis_client
-    if _redis_client is None:
-        _redis_client = await aioredis.from_url(REDIS_URL, decode_responses=False)
-    return _redis_client
+    headers = {"Cache-Control": "no-cache", "ETag": _FALLBACK_ETAG}
+    if request.headers.get("if-none-match") == _FALLBACK_ETAG:
+        return Response(status_code=304, headers=headers)
+    return Response(content=_FALLBACK_JPEG, media_type="image/jpeg", headers=headers)
 
 
 @router.get("/vision/snapshot.jpg")
-async def get_vision_snapshot():
+async def get_vision_snapshot(request: Request):
     """
     Get the current vision snapshot image.
     Reads from Redis if available, otherwise falls back to static sample image.
+    Redis snapshots carry an ETag (the snapshot version counter) so polling
+    clients get 304 Not Modified while the frame is unchanged.
     """
     try:
-        redis_client = await get_redis_client()
-        base64_jpeg = await redis_client.get(SNAPSHOT_KEY)
+        # Raw bytes client - snapshots are binary JPEG
+        redis_client = get_redis(decode_responses=False)
+        jpeg_bytes, version = await redis_client.mget(
+            SNAPSHOT_KEY, SNAPSHOT_VERSION_KEY
+        )
+
+        if jpeg_bytes:
+            headers = {"Cache-Control": "no-cache"}
+            if version is not None:
+                etag = f'"{version.decode()}"'
+                headers["ETag"] = etag
+                if request.headers.get("if-none-match") == etag:
+                    return Response(status_code=304, headers=headers)
 
-        if base64_jpeg:
-            # Decode base64 JPEG
             try:
-                # Redis returns bytes when decode_responses=False, decode to string first
-                base64_str = base64_jpeg.decode('utf-8')
-                jpeg_bytes = base64.b64decode(base64_str)
+                if not jpeg_bytes.startswith(_JPEG_MAGIC):
+                    jpeg_bytes = base64.b64decode(jpeg_bytes)
                 return Response(
                     content=jpeg_bytes,
                     media_type="image/jpeg",
-                    headers={"Cache-Control": "no-cache, no-store, must-revalidate"},
+                    headers=headers,
                 )
             except Exception as e:
-                print(f"Error decoding snapshot from Redis: {e}")
+                logger.warning("Error decoding snapshot from Redis: %s", e)
                 # Fall through to fallback
 
         # Fallback to static sample image
-        if SNAPSHOT_PATH.exists():
-            return FileResponse(
-                SNAPSHOT_PATH,
-                media_type="image/jpeg",
-                headers={"Cache-Control": "no-cache"},
-            )
-        else:
-            raise HTTPException(status_code=404, detail="Snapshot image not found")
+        return _fallback_response(request)
 
     except Exception as e:
-        print(f"Error getting vision snapshot: {e}")
+        logger.warning("Error getting vision snapshot: %s", e)
         # Fallback to static sample image if available
-        if SNAPSHOT_PATH.exists():
-            return FileResponse(
-                SNAPSHOT_PATH,
-                media_type="image/jpeg",
-                headers={"Cache-Control": "no-cache"},
-            )
-        raise HTTPException(status_code=404, detail="Snapshot image not found")
+        return _fallback_response(request)
@@ -1,17 +1,72 @@
 import re
-import uuid
-from datetime import datetime, timezone
+from typing import Callable, Dict
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import Response
 from pydantic import BaseModel
 
-from app.api.todos import get_all_todos
-from app.models.morning_report import Todo
-from app.util.storage import read_json, write_json
+from app.api.todos import append_todo
 from app.util.auth import require_capability, TokenData
 
 router = APIRouter()
 
+# Wake phrase (case-insensitive word boundary)
+_WAKE = re.compile(r"\bmira\b", re.IGNORECASE)
+
+# System intents, only considered when the wake phrase is present
+_SYSTEM_INTENT_TABLE = (
+    ("debug_on", r"enable.*debug|debug.*on"),
+    ("debug_off", r"disable.*debug|debug.*off"),
+    ("private_mode", r"private mode\s+(?P<code>\w+)"),
+    ("public_mode", r"public mode"),
+)
+
+# General intents; earlier entries win when matches start at the same position
+_INTENT_TABLE = (
+    (
+        "open_app",
+        r"\bopen\s+(?:the\s+)?"
+        r"(?P<app>home|dashboard|weather|email|mail|finance|news|todos?|calendar|settings)\b",
+    ),
+    ("nav_next", r"\bnext\b"),
+    ("nav_prev", r"\b(?:prev|previous)\b"),
+    ("nav_back", r"\bback\b"),
+    ("nav_select", r"\bselect\b"),
+    ("read_that", r"\bread\s+that\b"),
+    ("details", r"\bdetails\b"),
+    # Legacy patterns (kept for backward compatibility)
+    ("switch_mode", r"switch to (?P<mode>ambient|morning)"),
+    ("add_todo", r"add todo (?P<todo_text>.+)"),
+    ("complete_todo", r"(?:complete|mark|finish|done) todo (?P<identifier>.+)"),
+)
+
+
+def _compile_intents(table) -> re.Pattern:
+    """Fuse an intent table into one alternation with a named group per intent"""
+    return re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in table))
+
+
+# Single-pass scanners: one search walks the text once for every intent
+_SYSTEM_INTENTS = _compile_intents(_SYSTEM_INTENT_TABLE)
+_INTENTS = _compile_intents(_INTENT_TABLE)
+
+# Every general intent pattern contains one of these substrings, so text
+# without any of them is rejected before the regex engine runs
+_INTENT_KEYWORDS = (
+    "open",
+    "next",
+    "prev",
+    "back",
+    "select",
+    "read",
+    "details",
+    "switch to",
+    "todo",
+)
+
+# Spoken app names that map to a different app id
+_APP_ALIASES = {"dashboard": "home", "mail": "email", "todo": "todos"}
+
 
 class VoiceInterpretRequest(BaseModel):
     text: str
@@ -24,6 +79,74 @@ class VoiceInterpretResponse(BaseModel):
     parameters: dict
 
 
+def _response(
+    intent: str, confidence: float, parameters: dict, action: str = ""
+) -> VoiceInterpretResponse:
+    """Build a response; action defaults to the intent name"""
+    return VoiceInterpretResponse(
+        intent=intent,
+        confidence=confidence,
+        action=action or intent,
+        parameters=parameters,
+    )
+
+
+def _constant(
+    intent: str, confidence: float, parameters: dict
+) -> Callable[[re.Match], VoiceInterpretResponse]:
+    """Builder for intents whose response never varies (built once, shared)"""
+    response = _response(intent, confidence, parameters)
+    return lambda m: response
+
+
+# Spoken app name -> prebuilt open-app response (aliases resolved up front)
+_APP_RESPONSES: Dict[str, VoiceInterpretResponse] = {
+    spoken: _response("voice.openApp", 0.90, {"app": _APP_ALIASES.get(spoken, spoken)})
+    for spoken in (
+        "home",
+        "dashboard",
+        "weather",
+        "email",
+        "mail",
+        "finance",
+        "news",
+        "todo",
+        "todos",
+        "calendar",
+        "settings",
+    )
+}
+
+# Matched intent group -> response builder
+_INTENT_BUILDERS: Dict[str, Callable[[re.Match], VoiceInterpretResponse]] = {
+    "debug_on": _constant("system.toggleDebug", 0.95, {"enable": True}),
+    "debug_off": _constant("system.toggleDebug", 0.95, {"enable": False}),
+    "private_mode": lambda m: _response(
+        "system.setMode", 0.90, {"mode": "private", "code": m.group("code")}
+    ),
+    "public_mode": _constant("system.setMode", 0.90, {"mode": "public"}),
+    "open_app": lambda m: _APP_RESPONSES[m.group("app")],
+    "nav_next": _constant("voice.nav", 0.85, {"action": "next"}),
+    "nav_prev": _constant("voice.nav", 0.85, {"action": "prev"}),
+    "nav_back": _constant("voice.nav", 0.85, {"action": "back"}),
+    "nav_select": _constant("voice.nav", 0.85, {"action": "select"}),
+    "read_that": _constant("app.readAloud", 0.85, {}),
+    "details": _constant("app.details", 0.85, {}),
+    "switch_mode": lambda m: _response(
+        "switch_mode",
+        0.95,
+        {"mode": m.group("mode")},
+        action=f"switch_to_{m.group('mode')}",
+    ),
+    "complete_todo": lambda m: _response(
+        "complete_todo",
+        0.85,
+        {"identifier": m.group("identifier").strip()},
+        action="todo_completed",
+    ),
+}
+
+
 @router.post("/api/v1/voice/interpret", response_model=VoiceInterpretResponse)
 async def interpret_voice(
     request: VoiceInterpretRequest,
@@ -38,151 +161,41 @@ async def interpret_voice(
     - Legacy: switch to (ambient|morning), add todo, complete todo
     Requires 'command.send' capability.
     """
-    text = request.text.lower().strip()
+    result = await _interpret(request.text.lower().strip())
+    # Serialize straight from the model rather than through FastAPI's
+    # re-validate + jsonable_encoder path; response_model documents the schema
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
-    # Pattern: Mira wake phrase (case-insensitive word boundary)
-    wake_pattern = r"\bmira\b"
-    has_wake = re.search(wake_pattern, text, re.IGNORECASE) is not None
 
-    # System commands (require "Mira" wake phrase)
-    if has_wake:
-        # Debug overlay toggle
-        if re.search(r"enable.*debug|debug.*on", text):
-            return VoiceInterpretResponse(
-                intent="system.toggleDebug",
-                confidence=0.95,
-                action="system.toggleDebug",
-                parameters={"enable": True},
-            )
-        if re.search(r"disable.*debug|debug.*off", text):
-            return VoiceInterpretResponse(
-                intent="system.toggleDebug",
-                confidence=0.95,
-                action="system.toggleDebug",
-                parameters={"enable": False},
-            )
+async def _interpret(text: str) -> VoiceInterpretResponse:
+    """Match normalized text against the intent tables"""
+    match = None
 
-        # Privacy mode switching
-        private_pattern = r"private mode\s+(\w+)"
-        private_match = re.search(private_pattern, text)
-        if private_match:
-            code = private_match.group(1).strip()
-            return VoiceInterpretResponse(
-                intent="system.setMode",
-                confidence=0.90,
-                action="system.setMode",
-                parameters={"mode": "private", "code": code},
-            )
+    # System commands (require "Mira" wake phrase); cheap substring test first
+    if "mira" in text and _WAKE.search(text) is not None:
+        match = _SYSTEM_INTENTS.search(text)
 
-        if re.search(r"public mode", text):
-            return VoiceInterpretResponse(
-                intent="system.setMode",
-                confidence=0.90,
-                action="system.setMode",
-                parameters={"mode": "public"},
-            )
+    if match is None and any(keyword in text for keyword in _INTENT_KEYWORDS):
+        match = _INTENTS.search(text)
 
-    # App opening commands
-    app_patterns = {
-        r"\bopen\s+(?:the\s+)?(?:home|dashboard)\b": "home",
-        r"\bopen\s+(?:the\s+)?weather\b": "weather",
-        r"\bopen\s+(?:the\s+)?email\b": "email",
-        r"\bopen\s+(?:the\s+)?mail\b": "email",
-        r"\bopen\s+(?:the\s+)?finance\b": "finance",
-        r"\bopen\s+(?:the\s+)?news\b": "news",
-        r"\bopen\s+(?:the\s+)?todos?\b": "todos",
-        r"\bopen\s+(?:the\s+)?calendar\b": "calendar",
-        r"\bopen\s+(?:the\s+)?settings\b": "settings",
-    }
-
-    for pattern, app_id in app_patterns.items():
-        if re.search(pattern, text):
-            return VoiceInterpretResponse(
-                intent="voice.openApp",
-                confidence=0.90,
-                action="voice.openApp",
-                parameters={"app": app_id},
-            )
-
-    # Navigation commands
-    if re.search(r"\bnext\b", text):
-        return VoiceInterpretResponse(
-            intent="voice.nav",
-            confidence=0.85,
-            action="voice.nav",
-            parameters={"action": "next"},
-        )
-
-    if re.search(r"\b(?:prev|previous)\b", text):
-        return VoiceInterpretResponse(
-            intent="voice.nav",
-            confidence=0.85,
-            action="voice.nav",
-            parameters={"action": "prev"},
-        )
-
-    if re.search(r"\bback\b", text):
-        return VoiceInterpretResponse(
-            intent="voice.nav",
-            confidence=0.85,
-            action="voice.nav",
-            parameters={"action": "back"},
-        )
-
-    if re.search(r"\bselect\b", text):
-        return VoiceInterpretResponse(
-            intent="voice.nav",
-            confidence=0.85,
-            action="voice.nav",
-            parameters={"action": "select"},
-        )
-
-    if re.search(r"\bread\s+that\b", text):
-        return VoiceInterpretResponse(
-            intent="app.readAloud",
-            confidence=0.85,
-            action="app.readAloud",
-            parameters={},
-        )
-
-    if re.search(r"\bdetails\b", text):
+    if match is None:
+        # Unknown intent
         return VoiceInterpretResponse(
-            intent="app.details",
-            confidence=0.85,
-            action="app.details",
-            parameters={},
+            intent="unknown",
+            confidence=0.0,
+            action="no_action",
+            parameters={"original_text": text},
         )
 
-    # Legacy patterns (kept for backward compatibility)
-    # Pattern: switch to ambient/morning
-    mode_pattern = r"switch to (ambient|morning)"
-    mode_match = re.search(mode_pattern, text)
-    if mode_match:
-        mode = mode_match.group(1)
-        return VoiceInterpretResponse(
-            intent="switch_mode",
-            confidence=0.95,
-            action=f"switch_to_{mode}",
-            parameters={"mode": mode},
-        )
+    kind = match.lastgroup
 
     # Pattern: add todo
-    todo_pattern = r"add todo (.+)"
-    todo_match = re.search(todo_pattern, text)
-    if todo_match:
-        todo_text = todo_match.group(1).strip()
+    if kind == "add_todo":
+        todo_text = match.group("todo_text").strip()
 
         # Actually create the todo
         try:
-            todos_data = read_json()
-            new_todo = Todo(
-                id=str(uuid.uuid4()),
-                text=todo_text,
-                done=False,
-                createdAtISO=datetime.now(timezone.utc).isoformat(),
-            )
-            todos_data.append(new_todo.dict())
-            write_json(todos_data)
+            new_todo = await append_todo(todo_text)
 
             return VoiceInterpretResponse(
                 intent="add_todo",
@@ -198,22 +211,4 @@ async def interpret_voice(
                 parameters={"text": todo_text, "error": str(e)},
             )
 
-    # Pattern: complete/mark todo
-    complete_pattern = r"(complete|mark|finish|done) todo (.+)"
-    complete_match = re.search(complete_pattern, text)
-    if complete_match:
-        todo_identifier = complete_match.group(2).strip()
-        return VoiceInterpretResponse(
-            intent="complete_todo",
-            confidence=0.85,
-            action="todo_completed",
-            parameters={"identifier": todo_identifier},
-        )
-
-    # Unknown intent
-    return VoiceInterpretResponse(
-        intent="unknown",
-        confidence=0.0,
-        action="no_action",
-        parameters={"original_text": text},
-    )
+    return _INTENT_BUILDERS[kind](match)
@@ -1,6 +1,7 @@
 import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import (
@@ -13,6 +14,10 @@ from app.api import (
     vision,
     voice,
 )
+from app.util.control_plane_db import close_snapshot_db
+from app.util.http_clients import close_http_clients, get_control_plane_client
+from app.util.log import setup_logging, shutdown_logging
+from app.util.redis import close_redis
 from app.ws import state as state_ws
 from app.ws import vision as vision_ws
 
@@ -20,6 +25,9 @@ from app.ws import vision as vision_ws
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Start background tasks on application startup."""
+    setup_logging()
+    # Open the pooled Control Plane client so the first command skips setup
+    get_control_plane_client()
     # Start Redis subscriber for state updates
     state_task = asyncio.create_task(state_ws.redis_subscriber())
     # Start Redis subscriber for vision updates
@@ -37,6 +45,11 @@ async def lifespan(app: FastAPI):
         await vision_task
     except asyncio.CancelledError:
         pass
+    # Close pooled HTTP/Redis clients and database connections
+    await close_http_clients()
+    await close_redis()
+    await close_snapshot_db()
+    shutdown_logging()
 
 
 # Create FastAPI application
@@ -45,6 +58,7 @@ app = FastAPI(
     description="Backend API for the Mira smart mirror application",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
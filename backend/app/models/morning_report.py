@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from typing import List, Optional
 
 
@@ -9,6 +9,9 @@ class CalendarItem(BaseModel):
     endsAtISO: str
     location: Optional[str] = None
 
+    # startsAtISO as a Unix timestamp, set by providers that already have it
+    _starts_epoch: Optional[float] = PrivateAttr(default=None)
+
 
 class WeatherSnapshot(BaseModel):
     updatedISO: str
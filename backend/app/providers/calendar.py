@@ -1,5 +1,9 @@
+import heapq
+import time
 from datetime import datetime, timezone, timedelta
-from typing import List
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Tuple
 from app.models.morning_report import CalendarItem
 
 
@@ -8,24 +12,34 @@ def get_calendar_items(limit: int = 10) -> List[CalendarItem]:
     Get calendar items with mock implementation.
     Returns deterministic mock data with stale logic.
     """
-    now = datetime.now(timezone.utc)
+    return list(_build_calendar(int(time.time()) // 3600)[:limit])
+
 
-    # Mock calendar data - deterministic based on current hour
-    hour = now.hour
+@lru_cache(maxsize=2)
+def _build_calendar(hour_bucket: int) -> Tuple[CalendarItem, ...]:
+    """
+    Build the mock calendar for one hour (hour_bucket = epoch seconds // 3600).
+    Events start on the hour, so the result only changes when the hour does.
+    """
+    now = datetime.fromtimestamp(hour_bucket * 3600, timezone.utc)
     day_of_week = now.weekday()  # 0 = Monday, 6 = Sunday
 
-    # Generate mock calendar events for today and tomorrow
-    mock_events = []
+    # Generate mock calendar events for today and tomorrow; each group is
+    # produced in start order
+    today_events = []
+    tomorrow_events = []
+    weekend_events = []
 
     # Today's events
     for i in range(3):
         event_time = now.replace(hour=9 + i * 3, minute=0, second=0, microsecond=0)
         if event_time > now:  # Only future events
-            mock_events.append(
+            today_events.append(
                 {
                     "id": f"event_today_{i}",
                     "title": f"Meeting {i+1} - Project Discussion",
                     "startsAtISO": event_time.isoformat(),
+                    "startsEpoch": event_time.timestamp(),
                     "endsAtISO": (event_time + timedelta(hours=1)).isoformat(),
                     "location": f"Conference Room {chr(65 + i)}" if i < 2 else "Remote",
                 }
@@ -37,11 +51,12 @@ def get_calendar_items(limit: int = 10) -> List[CalendarItem]:
         event_time = tomorrow.replace(
             hour=10 + i * 4, minute=30, second=0, microsecond=0
         )
-        mock_events.append(
+        tomorrow_events.append(
             {
                 "id": f"event_tomorrow_{i}",
                 "title": f"Tomorrow's Event {i+1}",
                 "startsAtISO": event_time.isoformat(),
+                "startsEpoch": event_time.timestamp(),
                 "endsAtISO": (event_time + timedelta(hours=2)).isoformat(),
                 "location": "Main Office" if i == 0 else None,
             }
@@ -55,20 +70,31 @@ def get_calendar_items(limit: int = 10) -> List[CalendarItem]:
         weekend_start = weekend_start.replace(
             hour=14, minute=0, second=0, microsecond=0
         )
-        mock_events.append(
+        weekend_events.append(
             {
                 "id": "weekend_event",
                 "title": "Weekend Planning Session",
                 "startsAtISO": weekend_start.isoformat(),
+                "startsEpoch": weekend_start.timestamp(),
                 "endsAtISO": (weekend_start + timedelta(hours=1)).isoformat(),
                 "location": "Home Office",
             }
         )
 
-    # Return limited number of events, sorted by start time
-    events = [CalendarItem(**event) for event in mock_events]
-    events.sort(key=lambda x: x.startsAtISO)
-    return events[:limit]
+    # Merge the pre-sorted groups by start time
+    mock_events = heapq.merge(
+        today_events, tomorrow_events, weekend_events, key=itemgetter("startsEpoch")
+    )
+
+    # Trusted mock data - skip validation
+    events = []
+    for event in mock_events:
+        starts_epoch = event.pop("startsEpoch")
+        item = CalendarItem.model_construct(**event)
+        item._starts_epoch = starts_epoch
+        events.append(item)
+
+    return tuple(events)
 
 
 def get_live_calendar_items(
@@ -95,16 +121,20 @@ def get_upcoming_events(hours_ahead: int = 24) -> List[CalendarItem]:
     """
     Get calendar events for the next N hours.
     """
-    now = datetime.now(timezone.utc)
-    cutoff_time = now + timedelta(hours=hours_ahead)
+    now_ts = datetime.now(timezone.utc).timestamp()
+    cutoff_ts = now_ts + hours_ahead * 3600
 
     all_events = get_calendar_items()
 
     # Filter events that start within the time window
     upcoming = []
     for event in all_events:
-        event_start = datetime.fromisoformat(event.startsAtISO.replace("Z", "+00:00"))
-        if now <= event_start <= cutoff_time:
+        event_start = event._starts_epoch
+        if event_start is None:
+            event_start = datetime.fromisoformat(
+                event.startsAtISO.replace("Z", "+00:00")
+            ).timestamp()
+        if now_ts <= event_start <= cutoff_ts:
             upcoming.append(event)
 
     return upcoming
@@ -1,58 +1,80 @@
+import time
 from datetime import datetime, timezone, timedelta
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 from app.models.morning_report import NewsItem
 
+# Mock headlines: (number, title, source, url, age in hours)
+_NEWS_TEMPLATES = (
+    (
+        1,
+        "Tech Industry Shows Strong Growth in Q4",
+        "Tech News Daily",
+        "https://example.com/tech-growth-q4",
+        2,
+    ),
+    (
+        2,
+        "Climate Summit Reaches New Agreement",
+        "Global Times",
+        "https://example.com/climate-summit",
+        4,
+    ),
+    (
+        3,
+        "Local Sports Team Wins Championship",
+        "Sports Central",
+        "https://example.com/championship-win",
+        6,
+    ),
+    (
+        4,
+        "New AI Breakthrough in Medical Research",
+        "Science Weekly",
+        "https://example.com/ai-medical-research",
+        8,
+    ),
+    (
+        5,
+        "Economic Markets Show Positive Trends",
+        "Financial Times",
+        "https://example.com/economic-trends",
+        12,
+    ),
+)
+
 
 def get_news_items(limit: int = 5) -> List[NewsItem]:
     """
     Get news items with mock implementation.
     Returns deterministic mock data with stale logic.
     """
-    now = datetime.now(timezone.utc)
+    return list(_build_news(int(time.time()) // 3600)[:limit])
+
+
+@lru_cache(maxsize=2)
+def _build_news(hour_bucket: int) -> Tuple[NewsItem, ...]:
+    """
+    Build the mock headlines for one hour (hour_bucket = epoch seconds // 3600).
+    Ages are measured from the top of the hour, so the result only changes
+    when the hour does.
+    """
+    now = datetime.fromtimestamp(hour_bucket * 3600, timezone.utc)
 
     # Mock news data - deterministic based on current hour
     hour = now.hour
 
-    mock_news = [
-        {
-            "id": f"news_{hour}_1",
-            "title": "Tech Industry Shows Strong Growth in Q4",
-            "source": "Tech News Daily",
-            "url": "https://example.com/tech-growth-q4",
-            "publishedISO": (now - timedelta(hours=2)).isoformat(),
-        },
-        {
-            "id": f"news_{hour}_2",
-            "title": "Climate Summit Reaches New Agreement",
-            "source": "Global Times",
-            "url": "https://example.com/climate-summit",
-            "publishedISO": (now - timedelta(hours=4)).isoformat(),
-        },
-        {
-            "id": f"news_{hour}_3",
-            "title": "Local Sports Team Wins Championship",
-            "source": "Sports Central",
-            "url": "https://example.com/championship-win",
-            "publishedISO": (now - timedelta(hours=6)).isoformat(),
-        },
-        {
-            "id": f"news_{hour}_4",
-            "title": "New AI Breakthrough in Medical Research",
-            "source": "Science Weekly",
-            "url": "https://example.com/ai-medical-research",
-            "publishedISO": (now - timedelta(hours=8)).isoformat(),
-        },
-        {
-            "id": f"news_{hour}_5",
-            "title": "Economic Markets Show Positive Trends",
-            "source": "Financial Times",
-            "url": "https://example.com/economic-trends",
-            "publishedISO": (now - timedelta(hours=12)).isoformat(),
-        },
-    ]
-
-    # Return limited number of items
-    return [NewsItem(**item) for item in mock_news[:limit]]
+    # Trusted mock data - skip validation
+    return tuple(
+        NewsItem.model_construct(
+            id=f"news_{hour}_{n}",
+            title=title,
+            source=source,
+            url=url,
+            publishedISO=(now - timedelta(hours=age_hours)).isoformat(),
+        )
+        for n, title, source, url, age_hours in _NEWS_TEMPLATES
+    )
 
 
 def get_live_news_items(limit: int = 5, category: str = "general") -> List[NewsItem]:
@@ -1,34 +1,49 @@
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 from app.models.morning_report import WeatherSnapshot
 
+_CONDITIONS = ("sunny", "cloudy", "rainy", "partly_cloudy")
+_ICONS = MappingProxyType(
+    {"sunny": "☀️", "cloudy": "☁️", "rainy": "🌧️", "partly_cloudy": "⛅"}
+)
+
 
 def get_weather_snapshot() -> WeatherSnapshot:
     """
     Get weather data with mock implementation.
     Returns deterministic mock data with stale logic.
     """
-    now = datetime.now(timezone.utc)
+    return _build_weather(int(time.time()) // 3600)
+
+
+@lru_cache(maxsize=2)
+def _build_weather(hour_bucket: int) -> WeatherSnapshot:
+    """
+    Build the mock snapshot for one hour (hour_bucket = epoch seconds // 3600).
+    The mock only changes on the hour, so it is reported as updated then.
+    """
+    now = datetime.fromtimestamp(hour_bucket * 3600, timezone.utc)
 
     # Mock weather data - deterministic based on current hour
     hour = now.hour
-    conditions = ["sunny", "cloudy", "rainy", "partly_cloudy"]
-    condition = conditions[hour % len(conditions)]
+    condition = _CONDITIONS[hour % len(_CONDITIONS)]
 
     # Temperature varies by hour (20-25°C range)
-    temp_c = 20 + (hour % 6)
+    temp_c = 20.0 + (hour % 6)
 
     # Determine if data is stale (older than 30 minutes)
     # In mock mode, we'll simulate stale data every 5th call
     stale = hour % 5 == 0
 
-    icons = {"sunny": "☀️", "cloudy": "☁️", "rainy": "🌧️", "partly_cloudy": "⛅"}
-
-    return WeatherSnapshot(
+    # Trusted mock data - skip validation
+    return WeatherSnapshot.model_construct(
         updatedISO=now.isoformat(),
         tempC=temp_c,
         condition=condition,
-        icon=icons.get(condition, "☀️"),
+        icon=_ICONS[condition],
         stale=stale,
     )
 
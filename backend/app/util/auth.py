@@ -19,16 +19,31 @@ Usage:
         return {"status": "ok"}
 """
 
+import base64
+import hashlib
+import hmac
 import os
-from typing import List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import jwt
+import orjson
 from fastapi import HTTPException, Header, Depends
 from pydantic import BaseModel
 
 SECRET_KEY = os.getenv("JWT_SECRET", "dev-secret-change-in-production")
 ALGORITHM = "HS256"
 
+# HS256 signing state prepared once: the header segment never changes and the
+# keyed HMAC is copied per token instead of re-deriving the key each time
+_HEADER_SEGMENT = base64.urlsafe_b64encode(
+    orjson.dumps({"alg": ALGORITHM, "typ": "JWT"})
+).rstrip(b"=")
+_SECRET_BYTES = SECRET_KEY.encode()
+_SIGNER = hmac.new(_SECRET_BYTES, digestmod=hashlib.sha256)
+_ALGORITHMS = [ALGORITHM]
+
 
 class TokenData(BaseModel):
     """Parsed JWT token data"""
@@ -38,6 +53,111 @@ class TokenData(BaseModel):
     iat: int
 
 
+class _VerifiedToken:
+    """Cache entry for a verified token"""
+
+    __slots__ = ("payload", "cached_until", "token_data")
+
+    def __init__(self, payload: Dict[str, Any], cached_until: float):
+        self.payload = payload
+        self.cached_until = cached_until
+        # Built on first use by verify_token
+        self.token_data: Optional[TokenData] = None
+
+
+# Verified token cache (blake2b(token) -> entry), LRU-bounded
+VERIFIED_CACHE_TTL = 30.0
+VERIFIED_CACHE_MAXSIZE = 2048
+_verified_tokens: "OrderedDict[bytes, _VerifiedToken]" = OrderedDict()
+
+
+def encode_token(payload: Dict[str, Any]) -> str:
+    """
+    Sign a payload as an HS256 JWT.
+    Produces tokens PyJWT verifies; timestamps must already be ints.
+
+    Args:
+        payload: JSON-serializable claims
+
+    Returns:
+        Encoded JWT string
+    """
+    body = base64.urlsafe_b64encode(orjson.dumps(payload)).rstrip(b"=")
+    signing_input = _HEADER_SEGMENT + b"." + body
+    signer = _SIGNER.copy()
+    signer.update(signing_input)
+    signature = base64.urlsafe_b64encode(signer.digest()).rstrip(b"=")
+    return (signing_input + b"." + signature).decode()
+
+
+def _verify(token: str) -> _VerifiedToken:
+    """
+    Verify a JWT, reusing the result for tokens seen recently.
+    Cached entries expire after VERIFIED_CACHE_TTL seconds or at the token's
+    own exp claim, whichever comes first. Failures are never cached.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+
+    entry = _verified_tokens.get(key)
+    if entry is not None:
+        if now < entry.cached_until:
+            _verified_tokens.move_to_end(key)
+            return entry
+        del _verified_tokens[key]
+
+    payload = jwt.decode(token, _SECRET_BYTES, algorithms=_ALGORITHMS)
+
+    cached_until = now + VERIFIED_CACHE_TTL
+    if "exp" in payload:
+        cached_until = min(cached_until, payload["exp"])
+    entry = _VerifiedToken(payload, cached_until)
+    _verified_tokens[key] = entry
+    if len(_verified_tokens) > VERIFIED_CACHE_MAXSIZE:
+        _verified_tokens.popitem(last=False)
+
+    return entry
+
+
+def decode_token(token: str) -> Dict[str, Any]:
+    """
+    Decode and verify a JWT (cached, see _verify).
+
+    Args:
+        token: Raw JWT string
+
+    Returns:
+        Decoded token payload (shared between callers - do not mutate)
+
+    Raises:
+        jwt.ExpiredSignatureError: If the token has expired
+        jwt.InvalidTokenError: If the token is invalid
+    """
+    return _verify(token).payload
+
+
+def decode_token_data(token: str) -> TokenData:
+    """
+    Decode and verify a JWT into TokenData (cached, see _verify).
+
+    Returns:
+        TokenData (shared between callers - do not mutate)
+
+    Raises:
+        jwt.ExpiredSignatureError: If the token has expired
+        jwt.InvalidTokenError: If the token is invalid
+    """
+    entry = _verify(token)
+    if entry.token_data is None:
+        payload = entry.payload
+        entry.token_data = TokenData(
+            capabilities=payload.get("cap", []),
+            exp=payload["exp"],
+            iat=payload["iat"],
+        )
+    return entry.token_data
+
+
 async def verify_token(authorization: Optional[str] = Header(None)) -> TokenData:
     """
     Dependency that verifies JWT token from Authorization header.
@@ -69,12 +189,7 @@ async def verify_token(authorization: Optional[str] = Header(None)) -> TokenData
     token = authorization.replace("Bearer ", "")
 
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return TokenData(
-            capabilities=payload.get("cap", []),
-            exp=payload["exp"],
-            iat=payload["iat"],
-        )
+        return decode_token_data(token)
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=401,
@@ -89,10 +204,16 @@ async def verify_token(authorization: Optional[str] = Header(None)) -> TokenData
         )
 
 
+# One checker per capability, so every endpoint shares the same dependency
+# callable and FastAPI's per-request dependency cache can dedupe it
+_CAP_DEPS: Dict[str, Callable[..., Awaitable[TokenData]]] = {}
+
+
 def require_capability(required_cap: str):
     """
     Dependency factory that checks for a specific capability.
     Returns a dependency function that can be used with Depends().
+    Repeated calls with the same capability return the same function.
 
     Args:
         required_cap: The capability string to check for (e.g., "command.send")
@@ -109,6 +230,9 @@ def require_capability(required_cap: str):
             # User has "command.send" capability
             pass
     """
+    checker = _CAP_DEPS.get(required_cap)
+    if checker is not None:
+        return checker
 
     async def capability_checker(
         token: TokenData = Depends(verify_token),
@@ -120,6 +244,7 @@ def require_capability(required_cap: str):
             )
         return token
 
+    _CAP_DEPS[required_cap] = capability_checker
     return capability_checker
 
 
@@ -140,11 +265,6 @@ async def optional_auth(
     token = authorization.replace("Bearer ", "")
 
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return TokenData(
-            capabilities=payload.get("cap", []),
-            exp=payload["exp"],
-            iat=payload["iat"],
-        )
+        return decode_token_data(token)
     except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
         return None
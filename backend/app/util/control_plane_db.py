@@ -0,0 +1,106 @@
+"""
+Control Plane database access - shared read-only connection to the snapshot store.
+
+The Control Plane owns and writes control_plane.db; the backend only reads the
+latest state snapshot from it, so a single long-lived read-only connection is
+reused across requests instead of reopening the file per call.
+"""
+
+import asyncio
+import os
+import time
+from typing import Optional, Tuple, Union
+
+import aiosqlite
+
+DB_PATH = os.getenv("CONTROL_PLANE_DB", "/app/data/control_plane.db")
+
+# id is the INTEGER PRIMARY KEY (rowid), so this is a single btree seek
+LATEST_SNAPSHOT_SQL = "SELECT state FROM snapshots ORDER BY id DESC LIMIT 1"
+
+# Shared connection (lazy initialization - the Control Plane may create the
+# database after the backend has started)
+_db: Optional[aiosqlite.Connection] = None
+_db_lock = asyncio.Lock()
+
+# Latest snapshot JSON as bytes (monotonic fetch time, body). Invalidation is
+# TTL-only: frontend polls within the window share one query. The Control Plane
+# stores well-formed JSON, so it is served as-is without a parse/dump cycle.
+SNAPSHOT_CACHE_TTL = 0.3
+_state_cache: Optional[Tuple[float, Optional[bytes]]] = None
+
+
+async def _open_snapshot_db() -> aiosqlite.Connection:
+    """Open a read-only connection tuned for repeated small reads"""
+    db = await aiosqlite.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+    try:
+        await db.execute("PRAGMA query_only=1")
+        await db.execute("PRAGMA cache_size=-8000")
+        await db.execute("PRAGMA mmap_size=268435456")
+    except Exception:
+        await db.close()
+        raise
+    return db
+
+
+async def fetch_latest_snapshot() -> Optional[Union[str, bytes]]:
+    """
+    Fetch the raw JSON of the most recent state snapshot.
+
+    Returns:
+        Snapshot JSON (bytes for BLOB rows, str for rows written as TEXT
+        by older Control Planes), or None if no snapshots exist yet
+
+    Raises:
+        aiosqlite.Error: If the database cannot be opened or queried
+    """
+    global _db
+    async with _db_lock:
+        if _db is None:
+            _db = await _open_snapshot_db()
+        try:
+            async with _db.execute(LATEST_SNAPSHOT_SQL) as cursor:
+                row = await cursor.fetchone()
+        except Exception:
+            # Drop the connection so the next call reopens it
+            await close_snapshot_db()
+            raise
+    return row[0] if row else None
+
+
+async def fetch_latest_state_json() -> Optional[bytes]:
+    """
+    Fetch the most recent state snapshot as raw JSON bytes.
+    Results are cached for SNAPSHOT_CACHE_TTL seconds.
+
+    Returns:
+        Snapshot JSON bytes, or None if no snapshots exist yet
+
+    Raises:
+        aiosqlite.Error: If the database cannot be opened or queried
+    """
+    global _state_cache
+    now = time.monotonic()
+    if _state_cache is not None and now - _state_cache[0] < SNAPSHOT_CACHE_TTL:
+        return _state_cache[1]
+
+    snapshot = await fetch_latest_snapshot()
+    if not snapshot:
+        body = None
+    elif isinstance(snapshot, bytes):
+        body = snapshot
+    else:
+        body = snapshot.encode()
+    _state_cache = (now, body)
+    return body
+
+
+async def close_snapshot_db():
+    """Close the shared snapshot connection"""
+    global _db
+    if _db is not None:
+        db, _db = _db, None
+        try:
+            await db.close()
+        except Exception:
+            pass
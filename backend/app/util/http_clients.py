@@ -0,0 +1,44 @@
+"""
+Shared HTTP clients - pooled httpx.AsyncClient instances reused across requests.
+
+Usage:
+    from app.util.http_clients import JSON_HEADERS, get_control_plane_client
+
+    client = get_control_plane_client()
+    response = await client.post(
+        "/command", content=cmd.model_dump_json(), headers=JSON_HEADERS
+    )
+"""
+
+import os
+from typing import Optional
+
+import httpx
+
+CONTROL_PLANE_URL = os.getenv("CONTROL_PLANE_URL", "http://localhost:8090")
+
+# For bodies pre-serialized with model_dump_json() (skips httpx's json encoding)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Control Plane client (lazy initialization, closed on application shutdown)
+_control_plane_client: Optional[httpx.AsyncClient] = None
+
+
+def get_control_plane_client() -> httpx.AsyncClient:
+    """Get or create the pooled Control Plane client"""
+    global _control_plane_client
+    if _control_plane_client is None or _control_plane_client.is_closed:
+        _control_plane_client = httpx.AsyncClient(
+            base_url=CONTROL_PLANE_URL,
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _control_plane_client
+
+
+async def close_http_clients():
+    """Close all pooled HTTP clients"""
+    global _control_plane_client
+    if _control_plane_client is not None:
+        await _control_plane_client.aclose()
+        _control_plane_client = None
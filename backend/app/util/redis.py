@@ -0,0 +1,65 @@
+"""
+Shared Redis clients - pooled connections reused by the WebSocket subscribers
+and HTTP endpoints instead of one ad-hoc connection per module.
+
+Usage:
+    from app.util.redis import get_redis
+
+    r = get_redis()
+    pubsub = r.pubsub()
+"""
+
+import logging
+import os
+from typing import Dict
+
+import redis.asyncio as aioredis
+from redis.asyncio.client import PubSub
+from redis.backoff import ExponentialBackoff
+from redis.utils import HIREDIS_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+MAX_CONNECTIONS = 32
+
+# Delay before subscriber reconnect attempts: 0.1s doubling up to 10s, so a
+# transient blip recovers quickly without hammering a Redis that is down
+RECONNECT_BACKOFF = ExponentialBackoff(cap=10.0, base=0.1)
+
+# One client (and pool) per decode_responses setting, since decoding is a
+# connection-level option (lazy initialization, disconnected on shutdown)
+_clients: Dict[bool, aioredis.Redis] = {}
+
+
+def get_redis(decode_responses: bool = True) -> aioredis.Redis:
+    """Get or create the pooled Redis client"""
+    client = _clients.get(decode_responses)
+    if client is None:
+        if not HIREDIS_AVAILABLE:
+            # Still works, but pub/sub parsing falls back to pure Python
+            logger.warning("hiredis not installed; using the Python RESP parser")
+        pool = aioredis.ConnectionPool.from_url(
+            REDIS_URL,
+            decode_responses=decode_responses,
+            max_connections=MAX_CONNECTIONS,
+        )
+        client = aioredis.Redis(connection_pool=pool)
+        _clients[decode_responses] = client
+    return client
+
+
+async def close_pubsub(pubsub: PubSub):
+    """Close a PubSub and hand its connection back to the pool"""
+    try:
+        await pubsub.aclose()
+    except Exception:
+        pass
+
+
+async def close_redis():
+    """Disconnect all pooled Redis connections"""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.connection_pool.disconnect()
@@ -1,7 +1,19 @@
-import json
+import asyncio
 import os
 import tempfile
-from typing import Any
+from typing import Any, Dict, List, Tuple
+
+import orjson
+
+# Parsed file cache: path -> ((st_mtime_ns, st_size), data).
+# Entries are reused while the file on disk is unchanged and are replaced by
+# write_json only once the new file is in place. Callers share the cached
+# object, so read results are read-only: build a new list/dict to write.
+_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+# Key -> position indexes over cached lists: path -> (version, key, index).
+# Built lazily from the cached data and dropped whenever the file is rewritten.
+_index_cache: Dict[str, Tuple[Tuple[int, int], str, Dict[Any, int]]] = {}
 
 
 def get_data_dir() -> str:
@@ -21,29 +33,91 @@ def _ensure():
 
     os.makedirs(data_dir, exist_ok=True)
     if not os.path.exists(todo_file):
-        with open(todo_file, "w") as f:
-            json.dump([], f)
+        with open(todo_file, "wb") as f:
+            f.write(orjson.dumps([]))
 
 
 # Initialize on module import
 _ensure()
 
 
+def _file_version(path: str) -> Tuple[int, int]:
+    """Cheap change detector for a file (mtime + size)."""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
 def read_json(path=None):
-    """Read JSON data from file."""
+    """Read JSON data from file, reusing the cached parse if unchanged."""
+    if path is None:
+        path = get_todos_file_path()
+
+    version = _file_version(path)
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with open(path, "rb") as f:
+        data = orjson.loads(f.read())
+    _cache[path] = (version, data)
+    return data
+
+
+def read_json_indexed(key: str = "id", path=None) -> Tuple[List[Any], Dict[Any, int]]:
+    """Read a JSON list along with a item[key] -> position index."""
     if path is None:
         path = get_todos_file_path()
-    with open(path) as f:
-        return json.load(f)
+
+    data = read_json(path)
+    version = _cache[path][0]
+    cached = _index_cache.get(path)
+    if cached is not None and cached[0] == version and cached[1] == key:
+        return data, cached[2]
+
+    index = {item[key]: i for i, item in enumerate(data)}
+    _index_cache[path] = (version, key, index)
+    return data, index
 
 
 def write_json(obj: Any, path=None):
-    """Write JSON data to file atomically using temporary file."""
+    """Write JSON data to file atomically (and durably) using temporary file."""
     if path is None:
         path = get_todos_file_path()
 
-    data_dir = get_data_dir()
-    fd, tmp = tempfile.mkstemp(dir=data_dir)
-    with os.fdopen(fd, "w") as f:
-        json.dump(obj, f, indent=2)
-    os.replace(tmp, path)
+    # Serialize up front so the file gets a single write + fsync
+    buf = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    fd, tmp = tempfile.mkstemp(dir=get_data_dir())
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(buf)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        # The old file (and its cache entry) is still current
+        os.unlink(tmp)
+        raise
+
+    _index_cache.pop(path, None)
+    _cache[path] = (_file_version(path), obj)
+
+
+# Async variants: run the blocking file I/O (notably the fsync) in a worker
+# thread so route handlers don't stall the event loop
+
+
+async def aread_json(path=None):
+    """Async read_json."""
+    return await asyncio.to_thread(read_json, path)
+
+
+async def aread_json_indexed(
+    key: str = "id", path=None
+) -> Tuple[List[Any], Dict[Any, int]]:
+    """Async read_json_indexed."""
+    return await asyncio.to_thread(read_json_indexed, key, path)
+
+
+async def awrite_json(obj: Any, path=None):
+    """Async write_json."""
+    await asyncio.to_thread(write_json, obj, path)
@@ -3,20 +3,70 @@ State WebSocket - Subscribe to Redis Pub/Sub and forward state patches to client
 """
 
 import asyncio
-import json
-import os
-from typing import Set
+import logging
+from typing import FrozenSet, Set, Tuple
 
-import redis.asyncio as aioredis
+import msgpack
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from app.util.redis import RECONNECT_BACKOFF, close_pubsub, get_redis
+
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
-REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 CHANNEL = "mira:state"
 
-# Store all connected WebSocket clients
-clients: Set[WebSocket] = set()
+# Most patches coalesced into a single WebSocket frame
+MAX_BATCH = 64
+
+# Longest a single send may block (seconds) before the client is dropped,
+# so one stalled socket can't hold up the broadcast for everyone else
+SEND_TIMEOUT = 0.25
+
+# All connected WebSocket clients. Copy-on-write: connect/disconnect rebind
+# a new tuple, so a broadcast iterates a stable snapshot without copying it
+clients: Tuple[WebSocket, ...] = ()
+
+# Clients that connected with ?encoding=msgpack and get binary frames (same
+# copy-on-write scheme; also counted in `clients`). A frozenset, so the
+# per-client membership check during a broadcast is O(1)
+msgpack_clients: FrozenSet[WebSocket] = frozenset()
+
+# Background close tasks for dropped clients, referenced until they finish
+_closing: Set[asyncio.Task] = set()
+
+
+def _add_client(websocket: WebSocket, binary: bool = False):
+    """Register a connected client"""
+    global clients, msgpack_clients
+    clients = (*clients, websocket)
+    if binary:
+        msgpack_clients = msgpack_clients | {websocket}
+
+
+def _remove_clients(*websockets: WebSocket):
+    """Unregister clients (no-op for ones already removed)"""
+    global clients, msgpack_clients
+    clients = tuple(c for c in clients if c not in websockets)
+    msgpack_clients = msgpack_clients.difference(websockets)
+
+
+async def _close_quietly(websockets: Tuple[WebSocket, ...]):
+    """Close dropped clients so they reconnect, ignoring ones already gone"""
+    for websocket in websockets:
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+
+
+def _drop_clients(*websockets: WebSocket):
+    """Unregister clients and close them without blocking the broadcast"""
+    _remove_clients(*websockets)
+    task = asyncio.create_task(_close_quietly(websockets))
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
 
 
 async def redis_subscriber():
@@ -24,105 +74,134 @@ async def redis_subscriber():
     Background task that subscribes to Redis and forwards messages to all WebSocket clients.
     This runs once when the application starts.
     """
-    r = None
     pubsub = None
+    failures = 0
 
     while True:
         try:
-            # Close existing connection if reconnecting
+            # Drop the old subscription if reconnecting
             if pubsub:
-                try:
-                    # Break out of listen() loop by unsubscribing
-                    await pubsub.unsubscribe(CHANNEL)
-                except Exception:
-                    pass
+                await close_pubsub(pubsub)
                 pubsub = None
-            if r:
-                try:
-                    await r.close()
-                except Exception:
-                    pass
-                r = None
-
-            # Create new connection
-            r = await aioredis.from_url(REDIS_URL, decode_responses=True)
-            pubsub = r.pubsub()
+
+            # Subscribe on a connection from the shared pool; subscribe
+            # confirmations are filtered out by the client
+            pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
             await pubsub.subscribe(CHANNEL)
 
-            print(f"[State WS] Subscribed to Redis channel: {CHANNEL}")
+            logger.info("Subscribed to Redis channel: %s", CHANNEL)
+            failures = 0
 
             try:
-                async for msg in pubsub.listen():
-                    # Skip subscribe confirmation messages
-                    if msg["type"] == "subscribe":
+                while True:
+                    msg = await pubsub.get_message(timeout=1.0)
+                    if msg is None:
                         continue
 
-                    if msg["type"] == "message":
-                        try:
-                            data = json.loads(msg["data"])
-                            # Broadcast to all connected clients
-                            for client in list(clients):
+                    # Drain patches that are already buffered so a burst goes
+                    # out as one frame per client
+                    batch = [msg["data"]]
+                    while len(batch) < MAX_BATCH:
+                        msg = await pubsub.get_message(timeout=0)
+                        if msg is None:
+                            break
+                        batch.append(msg["data"])
+
+                    try:
+                        # The control plane publishes serialized JSON, so the
+                        # text is forwarded as-is rather than parsed and
+                        # re-encoded. A single patch is sent bare, a burst as
+                        # a JSON array
+                        if len(batch) == 1:
+                            frame = batch[0]
+                        else:
+                            frame = "[" + ",".join(batch) + "]"
+
+                        # Broadcast to all connected clients concurrently so
+                        # one slow socket doesn't delay the others
+                        targets = clients
+                        binary_targets = msgpack_clients
+
+                        # Patches are only parsed, and msgpack frames packed
+                        # once, when a client asked for binary frames
+                        packed = None
+                        if binary_targets:
+                            decoded = []
+                            for text in batch:
                                 try:
-                                    await client.send_json(data)
-                                except Exception as e:
-                                    print(f"[State WS] Error sending to client: {e}")
-                                    clients.discard(client)
-                        except json.JSONDecodeError as e:
-                            print(f"[State WS] Error decoding message: {e}")
-                        except Exception as e:
-                            print(f"[State WS] Error processing message: {e}")
+                                    decoded.append(orjson.loads(text))
+                                except orjson.JSONDecodeError as e:
+                                    logger.warning("Error decoding message: %s", e)
+                            if decoded:
+                                packed = msgpack.packb(
+                                    decoded[0] if len(decoded) == 1 else decoded
+                                )
+                            else:
+                                # Nothing to send binary clients this time
+                                targets = tuple(
+                                    c for c in targets if c not in binary_targets
+                                )
+
+                        results = await asyncio.gather(
+                            *(
+                                asyncio.wait_for(
+                                    client.send_bytes(packed)
+                                    if client in binary_targets
+                                    else client.send_text(frame),
+                                    SEND_TIMEOUT,
+                                )
+                                for client in targets
+                            ),
+                            return_exceptions=True,
+                        )
+                        failed = []
+                        for client, result in zip(targets, results):
+                            if isinstance(result, asyncio.TimeoutError):
+                                logger.info("Dropping client that is not keeping up")
+                                failed.append(client)
+                            elif isinstance(result, Exception):
+                                # Usually just a client that went away
+                                logger.debug("Error sending to client: %s", result)
+                                failed.append(client)
+                        if failed:
+                            _drop_clients(*failed)
+                    except Exception as e:
+                        logger.error("Error processing message: %s", e)
             except asyncio.CancelledError:
                 raise
             except Exception as e:
-                print(f"[State WS] Error in listen loop: {e}")
-                # Break out of the loop to reconnect
-                break
+                logger.warning("Error in listen loop: %s", e)
+                # Loop around to reconnect with a fresh connection
 
         except asyncio.CancelledError:
             # Clean shutdown
-            print("[State WS] Shutting down...")
+            logger.info("Shutting down...")
             if pubsub:
-                try:
-                    await pubsub.unsubscribe(CHANNEL)
-                    await pubsub.close()
-                except Exception:
-                    pass
-            if r:
-                try:
-                    await r.close()
-                except Exception:
-                    pass
+                await close_pubsub(pubsub)
             raise
         except Exception as e:
-            print(f"[State WS] Redis connection error: {e}")
+            logger.warning("Redis connection error: %s", e)
             # Clean up on error
             if pubsub:
-                try:
-                    await pubsub.unsubscribe(CHANNEL)
-                    await pubsub.close()
-                except Exception:
-                    pass
+                await close_pubsub(pubsub)
                 pubsub = None
-            if r:
-                try:
-                    await r.close()
-                except Exception:
-                    pass
-                r = None
-            # Retry after delay
-            await asyncio.sleep(5)
+            # Retry after a backoff that grows with consecutive failures
+            await asyncio.sleep(RECONNECT_BACKOFF.compute(failures))
+            failures += 1
 
 
 @router.websocket("/ws/state")
-async def state_websocket(websocket: WebSocket):
+async def state_websocket(websocket: WebSocket, encoding: str = "json"):
     """
     WebSocket endpoint for real-time state updates.
     Clients connect here to receive state patches broadcast from the Control Plane.
+    Frames are JSON text by default; connect with ?encoding=msgpack to receive
+    the same patches as msgpack binary frames.
     """
     await websocket.accept()
-    clients.add(websocket)
+    _add_client(websocket, binary=encoding == "msgpack")
 
-    print(f"[State WS] Client connected. Total clients: {len(clients)}")
+    logger.info("Client connected. Total clients: %d", len(clients))
 
     try:
         # Keep the connection alive and wait for disconnect
@@ -132,12 +211,12 @@ async def state_websocket(websocket: WebSocket):
             await websocket.receive_text()
 
     except WebSocketDisconnect:
-        print(f"[State WS] Client disconnected")
+        logger.debug("Client disconnected")
     except Exception as e:
-        print(f"[State WS] Error: {e}")
+        logger.warning("Error: %s", e)
     finally:
-        clients.discard(websocket)
-        print(f"[State WS] Client removed. Total clients: {len(clients)}")
+        _remove_clients(websocket)
+        logger.info("Client removed. Total clients: %d", len(clients))
         try:
             await websocket.close()
         except Exception:
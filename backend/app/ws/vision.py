@@ -4,20 +4,77 @@ Receives real-time gesture detection data from gesture-worker.
 """
 
 import asyncio
-import json
-import os
-from typing import Set
+import logging
+from typing import Tuple
 
-import redis.asyncio as aioredis
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from app.util.redis import RECONNECT_BACKOFF, close_pubsub, get_redis
+
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
-REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 VISION_CHANNEL = "mira:vision"
 
-# Store all connected WebSocket clients
-vision_clients: Set[WebSocket] = set()
+# Intents queued per client before the oldest are dropped; only the latest
+# intent matters to the UI, so a slow client just skips stale ones
+MAX_QUEUED = 8
+
+# Most buffered intents drained per wakeup; a burst is collapsed to its newest
+MAX_DRAIN = 64
+
+# Minimum gap between broadcasts (seconds); intents published in between
+# are coalesced into the newest by the next drain
+BROADCAST_INTERVAL = 0.05
+
+# Longest a single send may block (seconds) before the client is dropped
+SEND_TIMEOUT = 0.25
+
+# Outbound queue of every connected WebSocket client, drained by that
+# client's own writer task. Copy-on-write: connect/disconnect rebind a new
+# tuple, so a broadcast iterates a stable snapshot without copying it
+vision_clients: Tuple[asyncio.Queue, ...] = ()
+
+
+def _add_client(outbox: asyncio.Queue):
+    """Register a connected client's queue"""
+    global vision_clients
+    vision_clients = (*vision_clients, outbox)
+
+
+def _remove_client(outbox: asyncio.Queue):
+    """Unregister a client's queue (no-op if already removed)"""
+    global vision_clients
+    vision_clients = tuple(c for c in vision_clients if c is not outbox)
+
+
+def _broadcast(text: str):
+    """Queue a payload for every client without waiting on any socket"""
+    for outbox in vision_clients:
+        if outbox.full():
+            outbox.get_nowait()
+        outbox.put_nowait(text)
+
+
+async def _send_queued(websocket: WebSocket, outbox: asyncio.Queue):
+    """Writer task: send a client's queued payloads in order"""
+    # Bound once; this loop runs for every intent the client receives
+    send, get = websocket.send_text, outbox.get
+    try:
+        while True:
+            await asyncio.wait_for(send(await get()), SEND_TIMEOUT)
+    except asyncio.CancelledError:
+        raise
+    except asyncio.TimeoutError:
+        # Closing makes the receive loop clean up this client
+        logger.info("Dropping client that is not keeping up")
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+    except Exception as e:
+        # The receive loop sees the broken connection and cleans up
+        logger.debug("Error sending to client: %s", e)
 
 
 async def redis_vision_subscriber():
@@ -25,94 +82,71 @@ async def redis_vision_subscriber():
     Background task that subscribes to Redis vision channel
     and forwards vision intents to all WebSocket clients.
     """
-    r = None
     pubsub = None
+    failures = 0
 
     while True:
         try:
-            # Close existing connection if reconnecting
+            # Drop the old subscription if reconnecting
             if pubsub:
-                try:
-                    # Break out of listen() loop by closing the connection
-                    # This will cause the async for loop to exit
-                    await pubsub.unsubscribe(VISION_CHANNEL)
-                except Exception:
-                    pass
+                await close_pubsub(pubsub)
                 pubsub = None
-            if r:
-                try:
-                    await r.close()
-                except Exception:
-                    pass
-                r = None
-
-            # Create new connection
-            r = await aioredis.from_url(REDIS_URL, decode_responses=True)
-            pubsub = r.pubsub()
+
+            # Subscribe on a connection from the shared pool; subscribe
+            # confirmations are filtered out by the client
+            pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
             await pubsub.subscribe(VISION_CHANNEL)
 
-            print(f"[Vision WS] Subscribed to Redis channel: {VISION_CHANNEL}")
+            logger.info("Subscribed to Redis channel: %s", VISION_CHANNEL)
+            failures = 0
 
             try:
-                async for msg in pubsub.listen():
-                    # Skip subscribe confirmation messages
-                    if msg["type"] == "subscribe":
+                while True:
+                    msg = await pubsub.get_message(timeout=1.0)
+                    if msg is None:
                         continue
 
-                    if msg["type"] == "message":
-                        try:
-                            data = json.loads(msg["data"])
-                            # Broadcast to all connected clients
-                            for client in list(vision_clients):
-                                try:
-                                    await client.send_json(data)
-                                except Exception as e:
-                                    print(f"[Vision WS] Error sending to client: {e}")
-                                    vision_clients.discard(client)
-                        except json.JSONDecodeError as e:
-                            print(f"[Vision WS] Error decoding message: {e}")
-                        except Exception as e:
-                            print(f"[Vision WS] Error processing message: {e}")
+                    # Drain intents that are already buffered and keep only
+                    # the newest; clients display the latest gesture only
+                    for _ in range(MAX_DRAIN):
+                        newer = await pubsub.get_message(timeout=0)
+                        if newer is None:
+                            break
+                        msg = newer
+
+                    try:
+                        # The worker publishes serialized JSON, so the payload
+                        # is forwarded untouched; clients already drop frames
+                        # that fail to parse. Each client's writer task sends
+                        # it, so one slow socket can't hold up the others
+                        _broadcast(msg["data"])
+                    except Exception as e:
+                        logger.error("Error processing message: %s", e)
+
+                    # Throttle: the first intent of a burst goes out at once,
+                    # the rest of the window is collapsed on the next pass
+                    await asyncio.sleep(BROADCAST_INTERVAL)
             except asyncio.CancelledError:
                 raise
             except Exception as e:
-                print(f"[Vision WS] Error in listen loop: {e}")
-                # Break out of the loop to reconnect
-                break
+                logger.warning("Error in listen loop: %s", e)
+                # Loop around to reconnect with a fresh connection
 
         except asyncio.CancelledError:
             # Clean shutdown
-            print("[Vision WS] Shutting down...")
+            logger.info("Shutting down...")
             if pubsub:
-                try:
-                    await pubsub.unsubscribe(VISION_CHANNEL)
-                    await pubsub.close()
-                except Exception:
-                    pass
-            if r:
-                try:
-                    await r.close()
-                except Exception:
-                    pass
+                await close_pubsub(pubsub)
             raise
         except Exception as e:
-            print(f"[Vision WS] Redis connection error: {e}")
+            logger.warning("Redis connection error: %s", e)
             # Clean up on error
             if pubsub:
-                try:
-                    await pubsub.unsubscribe(VISION_CHANNEL)
-                    await pubsub.close()
-                except Exception:
-                    pass
+                await close_pubsub(pubsub)
                 pubsub = None
-            if r:
-                try:
-                    await r.close()
-                except Exception:
-                    pass
-                r = None
-            # Retry after delay
-            await asyncio.sleep(5)
+            # Retry after a backoff that grows with consecutive failures
+            await asyncio.sleep(RECONNECT_BACKOFF.compute(failures))
+            failures += 1
 
 
 @router.websocket("/ws/vision")
@@ -122,9 +156,11 @@ async def vision_websocket(websocket: WebSocket):
     Clients connect here to receive gesture detection data from the gesture-worker.
     """
     await websocket.accept()
-    vision_clients.add(websocket)
+    outbox: asyncio.Queue = asyncio.Queue(maxsize=MAX_QUEUED)
+    writer = asyncio.create_task(_send_queued(websocket, outbox))
+    _add_client(outbox)
 
-    print(f"[Vision WS] Client connected. Total clients: {len(vision_clients)}")
+    logger.info("Client connected. Total clients: %d", len(vision_clients))
 
     try:
         # Keep the connection alive and wait for disconnect
@@ -134,12 +170,13 @@ async def vision_websocket(websocket: WebSocket):
             await websocket.receive_text()
 
     except WebSocketDisconnect:
-        print(f"[Vision WS] Client disconnected")
+        logger.debug("Client disconnected")
     except Exception as e:
-        print(f"[Vision WS] Error: {e}")
+        logger.warning("Error: %s", e)
     finally:
-        vision_clients.discard(websocket)
-        print(f"[Vision WS] Client removed. Total clients: {len(vision_clients)}")
+        _remove_client(outbox)
+        writer.cancel()
+        logger.info("Client removed. Total clients: %d", len(vision_clients))
         try:
             await websocket.close()
         except Exception:
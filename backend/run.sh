@@ -7,4 +7,4 @@ if [ -d ".venv" ]; then
 fi
 
 # Run the server
-uvicorn app.main:app --reload --port 8080 --host 0.0.0.0
+uvicorn app.main:app --reload --port 8080 --host 0.0.0.0 --loop uvloop --http httptools --ws websockets
@@ -1,7 +1,6 @@
 """Pytest configuration and fixtures."""
 
 import os
-import tempfile
 import json
 from pathlib import Path
 
@@ -11,25 +10,32 @@ from fastapi.testclient import TestClient
 from app.main import app
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+@pytest.fixture(scope="session")
+def auth_headers():
+    """Bearer token from a PIN login (default PIN), with its full capabilities."""
+    response = TestClient(app).post("/auth/pin", data={"pin": "1234"})
+    return {"Authorization": f"Bearer {response.json()['token']}"}
+
+
+@pytest.fixture(scope="session")
+def client(auth_headers):
+    """Create one authorized test client for the FastAPI app, shared by the whole session."""
+    return TestClient(app, headers=auth_headers)
 
 
 @pytest.fixture
-def temp_data_dir(monkeypatch):
-    """Create a temporary directory for test data."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Set DATA_DIR environment variable BEFORE importing storage
-        monkeypatch.setenv("DATA_DIR", tmpdir)
+def temp_data_dir(monkeypatch, tmp_path):
+    """Create a temporary directory for test data (unique per test)."""
+    tmpdir = str(tmp_path)
+    # Set DATA_DIR environment variable BEFORE importing storage
+    monkeypatch.setenv("DATA_DIR", tmpdir)
 
-        # Re-initialize storage with new directory
-        from app.util import storage
+    # Re-initialize storage with new directory
+    from app.util import storage
 
-        storage._ensure()
+    storage._ensure()
 
-        yield tmpdir
+    return tmpdir
 
 
 @pytest.fixture
@@ -0,0 +1,134 @@
+"""Tests for JWT verification helpers."""
+
+import time
+
+import jwt
+import pytest
+
+from app.util import auth
+from app.util.auth import (
+    ALGORITHM,
+    SECRET_KEY,
+    decode_token,
+    decode_token_data,
+    encode_token,
+)
+
+
+def make_token(exp_offset: int = 3600, secret: str = SECRET_KEY) -> str:
+    """Create a signed token expiring exp_offset seconds from now."""
+    now = int(time.time())
+    payload = {"cap": ["command.send"], "exp": now + exp_offset, "iat": now}
+    return jwt.encode(payload, secret, algorithm=ALGORITHM)
+
+
+class TestDecodeToken:
+    """Tests for cached token decoding."""
+
+    def test_decode_valid_token(self):
+        """Test decoding a valid token returns its claims."""
+        payload = decode_token(make_token())
+        assert payload["cap"] == ["command.send"]
+
+    def test_repeat_decode_uses_cache(self, monkeypatch):
+        """Test that a repeat token is served without re-verifying."""
+        token = make_token()
+        first = decode_token(token)
+
+        def fail_decode(*args, **kwargs):
+            raise AssertionError("jwt.decode should not be called on a cache hit")
+
+        monkeypatch.setattr(auth.jwt, "decode", fail_decode)
+        assert decode_token(token) is first
+
+    def test_token_data_reused(self):
+        """Test that TokenData is built once per cached token."""
+        token = make_token()
+        data = decode_token_data(token)
+
+        assert data.capabilities == ["command.send"]
+        assert decode_token_data(token) is data
+
+    def test_expired_token_rejected(self):
+        """Test that an expired token raises."""
+        with pytest.raises(jwt.ExpiredSignatureError):
+            decode_token(make_token(exp_offset=-10))
+
+    def test_invalid_token_not_cached(self):
+        """Test that failed verifications are not cached."""
+        token = make_token(secret="wrong-secret")
+        with pytest.raises(jwt.InvalidTokenError):
+            decode_token(token)
+        with pytest.raises(jwt.InvalidTokenError):
+            decode_token(token)
+
+    def test_cache_entry_expires_with_token(self, monkeypatch):
+        """Test that a cached token is re-verified once past its exp claim."""
+        token = make_token(exp_offset=5)
+        decode_token(token)
+
+        calls = []
+        real_decode = auth.jwt.decode
+
+        def counting_decode(*args, **kwargs):
+            calls.append(args)
+            return real_decode(*args, **kwargs)
+
+        real_time = time.time
+        monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+        monkeypatch.setattr(auth.time, "time", lambda: real_time() + 10)
+        decode_token(token)
+        assert len(calls) == 1
+
+
+class TestEncodeToken:
+    """Tests for the precomputed HS256 encoder."""
+
+    def test_pyjwt_verifies_encoded_token(self):
+        """Test that PyJWT accepts and decodes our tokens."""
+        now = int(time.time())
+        payload = {"cap": ["command.send"], "exp": now + 60, "iat": now}
+        token = encode_token(payload)
+
+        assert jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]) == payload
+        assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+
+    def test_wrong_secret_rejected(self):
+        """Test that the signature is bound to the secret."""
+        token = encode_token({"exp": int(time.time()) + 60})
+        with pytest.raises(jwt.InvalidSignatureError):
+            jwt.decode(token, "other-secret", algorithms=[ALGORITHM])
+
+
+class TestRequireCapability:
+    """Tests for the require_capability dependency factory."""
+
+    def test_same_capability_returns_same_dependency(self):
+        """Test that dependency identity is stable per capability."""
+        assert auth.require_capability("command.send") is auth.require_capability(
+            "command.send"
+        )
+
+    def test_different_capabilities_return_different_dependencies(self):
+        """Test that each capability gets its own checker."""
+        assert auth.require_capability("command.send") is not auth.require_capability(
+            "settings.write"
+        )
+
+
+class TestPinLogin:
+    """Tests for the PIN login endpoint."""
+
+    def test_valid_pin_returns_token(self, client):
+        """Test that the default PIN yields a verifiable token."""
+        response = client.post("/auth/pin", data={"pin": "1234"})
+        assert response.status_code == 200
+
+        data = response.json()
+        assert "command.send" in data["capabilities"]
+        assert decode_token(data["token"])["cap"] == data["capabilities"]
+
+    def test_invalid_pin_rejected(self, client):
+        """Test that a wrong PIN is rejected."""
+        response = client.post("/auth/pin", data={"pin": "0000"})
+        assert response.status_code == 401
@@ -0,0 +1,93 @@
+"""Tests for JSON file storage."""
+
+import os
+
+import orjson
+
+from app.util.storage import (
+    get_todos_file_path,
+    read_json,
+    read_json_indexed,
+    write_json,
+)
+
+
+def test_read_empty_todos(temp_data_dir):
+    """Test reading the freshly initialized todos file."""
+    assert read_json() == []
+
+
+def test_write_then_read(temp_data_dir):
+    """Test that written data is read back."""
+    data = [{"id": "1", "text": "Test", "done": False, "createdAtISO": "x"}]
+    write_json(data)
+
+    assert read_json() == data
+
+    with open(get_todos_file_path(), "rb") as f:
+        assert orjson.loads(f.read()) == data
+
+
+def test_read_reuses_cached_parse(temp_data_dir):
+    """Test that repeated reads of an unchanged file share one parse."""
+    assert read_json() is read_json()
+
+
+def test_read_detects_external_change(temp_data_dir):
+    """Test that a file changed outside write_json is reloaded."""
+    read_json()
+
+    path = get_todos_file_path()
+    with open(path, "wb") as f:
+        f.write(orjson.dumps([{"id": "external"}]))
+    # Make sure the change is visible even on coarse mtime filesystems
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert read_json() == [{"id": "external"}]
+
+
+def test_read_indexed(temp_data_dir):
+    """Test the id -> position index over the cached list."""
+    write_json([{"id": "a"}, {"id": "b"}])
+
+    data, index = read_json_indexed()
+    assert index == {"a": 0, "b": 1}
+    assert data[index["b"]] == {"id": "b"}
+
+    # Index is reused until the file is rewritten
+    assert read_json_indexed()[1] is index
+
+    write_json(data[1:])
+    assert read_json_indexed()[1] == {"b": 0}
+
+
+def test_failed_write_leaves_no_temp_file(temp_data_dir):
+    """Test that a write that fails to serialize leaves the data dir clean."""
+    write_json([{"id": "a"}])
+
+    try:
+        write_json([object()])
+    except TypeError:
+        pass
+
+    assert sorted(os.listdir(temp_data_dir)) == ["todos.json"]
+    assert read_json() == [{"id": "a"}]
+
+
+def test_failed_replace_keeps_cached_data(temp_data_dir, monkeypatch):
+    """Test that the cache only takes a new object once it is on disk."""
+    write_json([{"id": "a"}])
+    before = read_json()
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail)
+    try:
+        write_json([*before, {"id": "b"}])
+    except OSError:
+        pass
+
+    assert read_json() is before
+    assert before == [{"id": "a"}]
@@ -120,6 +120,27 @@ def test_delete_todo_not_found(client: TestClient, temp_data_dir):
     assert response.status_code == 404
 
 
+@pytest.mark.parametrize(
+    "text", ["Buy groceries", "Walk the dog", "Write tests", "  padded  ", "ünïcødé"]
+)
+def test_todo_lifecycle(client: TestClient, temp_data_dir, text):
+    """Test create -> get -> delete for one todo."""
+    create_response = client.post("/api/v1/todos", json={"text": text})
+    assert create_response.status_code == 200
+    created = create_response.json()
+    assert created["text"] == text
+    assert created["done"] is False  # New todos always start open
+
+    get_response = client.get(f"/api/v1/todos/{created['id']}")
+    assert get_response.status_code == 200
+    assert get_response.json() == created
+
+    delete_response = client.delete(f"/api/v1/todos/{created['id']}")
+    assert delete_response.status_code == 200
+
+    assert client.get(f"/api/v1/todos/{created['id']}").status_code == 404
+
+
 def test_todos_persistence(client: TestClient, temp_data_dir, sample_todos):
     """Test that todos persist across requests."""
     # Create multiple todos
@@ -0,0 +1,64 @@
+"""Tests for the vision snapshot endpoint."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import vision
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in returning fixed MGET values."""
+
+    def __init__(self, values):
+        self.values = values
+
+    async def mget(self, *keys):
+        return self.values
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Patch the vision Redis client with a FakeRedis."""
+
+    def install(values):
+        monkeypatch.setattr(
+            vision, "get_redis", lambda decode_responses=True: FakeRedis(values)
+        )
+
+    return install
+
+
+class TestVisionSnapshot:
+    """Tests for /vision/snapshot.jpg."""
+
+    def test_fallback_when_no_snapshot(self, client: TestClient, fake_redis):
+        """Test that the sample image is served when Redis has no frame."""
+        fake_redis([None, None])
+        response = client.get("/vision/snapshot.jpg")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/jpeg"
+        assert response.content == vision.SNAPSHOT_PATH.read_bytes()
+        assert response.headers["etag"] == vision._FALLBACK_ETAG
+
+    def test_fallback_not_modified(self, client: TestClient, fake_redis):
+        """Test that a matching If-None-Match gets 304 for the sample image."""
+        fake_redis([None, None])
+        response = client.get(
+            "/vision/snapshot.jpg", headers={"If-None-Match": vision._FALLBACK_ETAG}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_redis_snapshot_with_version(self, client: TestClient, fake_redis):
+        """Test that Redis frames are served raw with a version ETag."""
+        fake_redis([b"\xff\xd8frame", b"7"])
+        response = client.get("/vision/snapshot.jpg")
+
+        assert response.status_code == 200
+        assert response.content == b"\xff\xd8frame"
+        assert response.headers["etag"] == '"7"'
+
+        response = client.get("/vision/snapshot.jpg", headers={"If-None-Match": '"7"'})
+        assert response.status_code == 304
@@ -73,6 +73,45 @@ class TestVoiceInterpret:
         assert todo["text"] == "test voice todo"
         assert todo["done"] is False
 
+    def test_add_todo_text_containing_command_words(
+        self, client: TestClient, temp_data_dir
+    ):
+        """Test that command words inside todo text don't hijack the intent."""
+        response = client.post(
+            "/api/v1/voice/interpret", json={"text": "add todo go back to the store"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["intent"] == "add_todo"
+        assert data["parameters"]["text"] == "go back to the store"
+
+    @pytest.mark.parametrize(
+        "text,intent,parameters",
+        [
+            # The intent whose match starts first in the text wins
+            ("go back to next", "voice.nav", {"action": "back"}),
+            ("next then go back", "voice.nav", {"action": "next"}),
+            ("open weather and go back", "voice.openApp", {"app": "weather"}),
+            ("mira public mode enable debug", "system.setMode", {"mode": "public"}),
+            (
+                "mira enable debug then public mode",
+                "system.toggleDebug",
+                {"enable": True},
+            ),
+        ],
+    )
+    def test_leftmost_intent_wins(self, client: TestClient, text, intent, parameters):
+        """Test that the earliest match in the text decides between intents."""
+        response = client.post("/api/v1/voice/interpret", json={"text": text})
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["intent"] == intent
+        assert data["parameters"] == parameters
+
     def test_complete_todo_command(self, client: TestClient):
         """Test complete todo voice command."""
         response = client.post(
@@ -111,6 +150,26 @@ class TestVoiceInterpret:
         assert data["confidence"] == 0.0
         assert "original_text" in data["parameters"]
 
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "i was reading the news",
+            "we opened the window",
+            "previously on the show",
+            "a todo list",
+        ],
+    )
+    def test_unknown_command_with_keyword(self, client: TestClient, text):
+        """Test text containing an intent keyword that matches no intent."""
+        response = client.post("/api/v1/voice/interpret", json={"text": text})
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["intent"] == "unknown"
+        assert data["action"] == "no_action"
+        assert data["parameters"]["original_text"] == text
+
     def test_case_insensitive_parsing(self, client: TestClient):
         """Test that voice commands are case insensitive."""
         response = client.post(
@@ -160,3 +219,77 @@ class TestVoiceInterpret:
         )
 
         assert response.status_code == 422  # Validation error
+
+    @pytest.mark.parametrize(
+        "text,app_id",
+        [
+            ("open weather", "weather"),
+            ("open the news", "news"),
+            ("open mail", "email"),
+            ("open the dashboard", "home"),
+            ("please open todo", "todos"),
+            ("open settings", "settings"),
+        ],
+    )
+    def test_open_app_command(self, client: TestClient, text, app_id):
+        """Test app opening voice commands."""
+        response = client.post("/api/v1/voice/interpret", json={"text": text})
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["intent"] == "voice.openApp"
+        assert data["parameters"] == {"app": app_id}
+
+    @pytest.mark.parametrize(
+        "text,intent,parameters",
+        [
+            ("next", "voice.nav", {"action": "next"}),
+            ("go previous", "voice.nav", {"action": "prev"}),
+            ("back", "voice.nav", {"action": "back"}),
+            ("select", "voice.nav", {"action": "select"}),
+            ("read that", "app.readAloud", {}),
+            ("show details", "app.details", {}),
+        ],
+    )
+    def test_navigation_commands(self, client: TestClient, text, intent, parameters):
+        """Test navigation voice commands."""
+        response = client.post("/api/v1/voice/interpret", json={"text": text})
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["intent"] == intent
+        assert data["parameters"] == parameters
+
+    @pytest.mark.parametrize(
+        "text,intent,parameters",
+        [
+            ("Mira enable debug overlay", "system.toggleDebug", {"enable": True}),
+            ("mira disable debug", "system.toggleDebug", {"enable": False}),
+            (
+                "Mira private mode unlock",
+                "system.setMode",
+                {"mode": "private", "code": "unlock"},
+            ),
+            ("mira public mode", "system.setMode", {"mode": "public"}),
+        ],
+    )
+    def test_system_commands(self, client: TestClient, text, intent, parameters):
+        """Test wake-gated system voice commands."""
+        response = client.post("/api/v1/voice/interpret", json={"text": text})
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["intent"] == intent
+        assert data["parameters"] == parameters
+
+    def test_system_command_requires_wake_word(self, client: TestClient):
+        """Test that system commands are ignored without the wake word."""
+        response = client.post(
+            "/api/v1/voice/interpret", json={"text": "enable debug overlay"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["intent"] != "system.toggleDebug"
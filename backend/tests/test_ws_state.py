@@ -0,0 +1,106 @@
+"""Tests for the state WebSocket broadcast loop."""
+
+import asyncio
+
+import msgpack
+import orjson
+import pytest
+
+from app.ws import state
+
+
+class FakePubSub:
+    """Hands out queued messages, then stops the subscriber."""
+
+    def __init__(self, messages):
+        self.messages = list(messages)
+
+    async def subscribe(self, channel):
+        pass
+
+    async def get_message(self, timeout):
+        if self.messages:
+            return {"data": self.messages.pop(0)}
+        if timeout:
+            # Queue drained and the loop is waiting again: shut it down
+            raise asyncio.CancelledError
+        return None
+
+    async def aclose(self):
+        pass
+
+
+class FakeRedis:
+    def __init__(self, messages):
+        self.messages = messages
+
+    def pubsub(self, **kwargs):
+        return FakePubSub(self.messages)
+
+
+class FakeWebSocket:
+    """Records the frames sent to it."""
+
+    def __init__(self):
+        self.text = []
+        self.binary = []
+
+    async def send_text(self, data):
+        self.text.append(data)
+
+    async def send_bytes(self, data):
+        self.binary.append(data)
+
+
+@pytest.fixture
+def broadcast(monkeypatch):
+    """Run one subscriber pass over the given messages."""
+
+    def run(messages):
+        monkeypatch.setattr(state, "get_redis", lambda: FakeRedis(messages))
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(state.redis_subscriber())
+
+    yield run
+    state._remove_clients(*state.clients)
+
+
+def test_patches_forwarded_without_parsing(broadcast, monkeypatch):
+    """Test that JSON-only clients get the published text untouched."""
+    ws = FakeWebSocket()
+    state._add_client(ws)
+
+    def fail(_):
+        raise AssertionError("patch was parsed")
+
+    monkeypatch.setattr(state.orjson, "loads", fail)
+    broadcast(['{"path":"/mode","value":"voice"}'])
+
+    assert ws.text == ['{"path":"/mode","value":"voice"}']
+
+
+def test_burst_sent_as_array(broadcast):
+    """Test that buffered patches share one array frame."""
+    ws = FakeWebSocket()
+    state._add_client(ws)
+
+    broadcast(['{"path":"/a","value":1}', '{"path":"/b","value":2}'])
+
+    assert [orjson.loads(frame) for frame in ws.text] == [
+        [{"path": "/a", "value": 1}, {"path": "/b", "value": 2}]
+    ]
+
+
+def test_msgpack_clients_get_binary_frames(broadcast):
+    """Test that msgpack clients get packed patches alongside JSON clients."""
+    text_ws, binary_ws = FakeWebSocket(), FakeWebSocket()
+    state._add_client(text_ws)
+    state._add_client(binary_ws, binary=True)
+
+    broadcast(['{"path":"/mode","value":"voice"}'])
+
+    assert text_ws.text == ['{"path":"/mode","value":"voice"}']
+    assert binary_ws.text == []
+    assert [msgpack.unpackb(frame) for frame in binary_ws.binary] == [
+        {"path": "/mode", "value": "voice"}
+    ]
@@ -1,12 +1,16 @@
-from ..models.core import Command, Event, StatePatch
+from ..models.core import Command, Event, StatePatch, utc_now_iso
 from ..services.bus import publish_state
+from ..services.db import read_latest_snapshot, write_event, write_snapshot
+from .constants import PRIVATE_APPS
 from .state import state
-import json
-import aiosqlite
-from datetime import datetime
+import logging
+import orjson
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 # App registry (matches frontend)
-APP_REGISTRY = [
+APP_REGISTRY = (
     "home",
     "weather",
     "email",  # Private only
@@ -15,43 +19,242 @@ APP_REGISTRY = [
     "todos",
     "calendar",
     "settings",  # Always visible
-]
+)
+
+# Visible apps per privacy mode, and each app's position in that order,
+# computed once; any mode other than "public" sees the full registry
+_PUBLIC_APPS = tuple(app for app in APP_REGISTRY if app not in PRIVATE_APPS)
+_VISIBLE_APPS = {"public": _PUBLIC_APPS, "private": APP_REGISTRY}
+_APP_INDEX = {
+    mode: {app: i for i, app in enumerate(apps)} for mode, apps in _VISIBLE_APPS.items()
+}
 
 
-def _get_visible_apps(mode: str) -> list:
+def _get_visible_apps(mode: str) -> Tuple[str, ...]:
     """Get visible apps based on privacy mode"""
-    if mode == "public":
-        return [app for app in APP_REGISTRY if app not in ["email", "finance"]]
-    return APP_REGISTRY
+    return _VISIBLE_APPS.get(mode, APP_REGISTRY)
+
+
+def _app_index(current_app: str, mode: str) -> Optional[int]:
+    """Position of an app among the visible apps, or None if not visible"""
+    return _APP_INDEX.get(mode, _APP_INDEX["private"]).get(current_app)
 
 
 def _is_app_visible(app_id: str, mode: str) -> bool:
     """Check if app is visible in current mode"""
-    return app_id in _get_visible_apps(mode)
+    return _app_index(app_id, mode) is not None
 
 
 def _get_next_app(current_app: str, mode: str) -> str:
     """Get next app in registry"""
     visible_apps = _get_visible_apps(mode)
-    try:
-        current_idx = visible_apps.index(current_app)
-        next_idx = (current_idx + 1) % len(visible_apps)
-        return visible_apps[next_idx]
-    except ValueError:
+    current_idx = _app_index(current_app, mode)
+    if current_idx is None:
         # Current app not in visible list, return first
-        return visible_apps[0] if visible_apps else "home"
+        return visible_apps[0]
+    return visible_apps[(current_idx + 1) % len(visible_apps)]
 
 
 def _get_prev_app(current_app: str, mode: str) -> str:
     """Get previous app in registry"""
     visible_apps = _get_visible_apps(mode)
-    try:
-        current_idx = visible_apps.index(current_app)
-        prev_idx = (current_idx - 1) % len(visible_apps)
-        return visible_apps[prev_idx]
-    except ValueError:
+    current_idx = _app_index(current_app, mode)
+    if current_idx is None:
         # Current app not in visible list, return last
-        return visible_apps[-1] if visible_apps else "home"
+        return visible_apps[-1]
+    return visible_apps[(current_idx - 1) % len(visible_apps)]
+
+
+async def _emit_patch(cmd: Command, path: str, value: Any) -> Event:
+    """Reduce a command to one state patch: apply, persist and broadcast it"""
+    # Built from an already-validated command, so validation is skipped
+    patch = StatePatch.model_construct(ts=cmd.ts, path=path, value=value)
+    # Dumped once for both the event payload and the broadcast
+    patch_dict = patch.model_dump()
+    event = Event.model_construct(
+        id=cmd.id,
+        ts=cmd.ts,
+        commandId=cmd.id,
+        type="state_patch",
+        payload=patch_dict,
+    )
+
+    changed = state.apply_patch(patch.path, patch.value)
+    await persist_event(event)
+    # Subscribers already hold the current value when the patch was a no-op
+    if changed:
+        await publish_state(patch_dict)
+    return event
+
+
+def _noop_event(cmd: Command) -> Event:
+    """Accept a command that would not change state; nothing is persisted or sent"""
+    return Event.model_construct(
+        id=cmd.id,
+        ts=cmd.ts,
+        commandId=cmd.id,
+        type="accepted",
+        payload={"action": cmd.action, "noop": True},
+    )
+
+
+async def _emit_event(cmd: Command, type: str, payload: Dict[str, Any]) -> Event:
+    """Persist an accepted/rejected outcome that changes no state"""
+    event = Event.model_construct(
+        id=cmd.id, ts=cmd.ts, commandId=cmd.id, type=type, payload=payload
+    )
+    await persist_event(event)
+    return event
+
+
+async def _add_todo(cmd: Command) -> Event:
+    return await _emit_patch(
+        cmd,
+        "/todos/+",
+        {
+            "id": state.allocate_todo_id(),
+            "text": cmd.payload.get("text", ""),
+            "completed": False,
+            "created_at": cmd.ts,
+        },
+    )
+
+
+async def _set_mode(cmd: Command) -> Event:
+    return await _emit_patch(cmd, "/mode", cmd.payload.get("mode", "idle"))
+
+
+async def _gesture(cmd: Command) -> Event:
+    return await _emit_patch(cmd, "/last_gesture", cmd.payload.get("gesture", "idle"))
+
+
+async def _set_gn_armed(cmd: Command) -> Event:
+    gn_armed = cmd.payload.get("gnArmed", False)
+    if gn_armed == state.gn_armed:
+        return _noop_event(cmd)
+    return await _emit_patch(cmd, "/ui/gnArmed", gn_armed)
+
+
+async def _nav_back_or_home(cmd: Command) -> Optional[Event]:
+    # Navigate back or to home
+    if state.app_route != "home":
+        return await _emit_patch(cmd, "/ui/appRoute", "home")
+    return None
+
+
+async def _app_navigate(cmd: Command) -> Event:
+    # App-specific navigation will be handled by frontend
+    # Just acknowledge the command
+    direction = cmd.payload.get("direction", "next")
+    return await _emit_event(
+        cmd, "accepted", {"action": cmd.action, "direction": direction}
+    )
+
+
+async def _voice_open_app(cmd: Command) -> Optional[Event]:
+    app_id = cmd.payload.get("app")
+    if app_id and _is_app_visible(app_id, state.ui_mode):
+        return await _emit_patch(cmd, "/ui/appRoute", app_id)
+    return None
+
+
+# Spoken navigation -> the command it stands for
+_VOICE_NAV_ACTIONS = {
+    "next": "nav.nextApp",
+    "prev": "nav.prevApp",
+    "previous": "nav.prevApp",
+    "back": "nav.backOrHome",
+    "select": "app.selectFocus",
+}
+
+
+async def _voice_nav(cmd: Command) -> Optional[Event]:
+    # Translate voice nav to the handler of the command it stands for; those
+    # handlers ignore the payload, so the voice command is passed through as-is
+    action = _VOICE_NAV_ACTIONS.get(cmd.payload.get("action"))
+    if action is None:
+        return None
+    return await _HANDLERS[action](cmd)
+
+
+async def _system_set_mode(cmd: Command) -> Event:
+    new_mode = cmd.payload.get("mode")
+    code = cmd.payload.get("code")
+    private_code = "unlock"  # Should be from env/config
+
+    if new_mode == "private":
+        # Require code
+        if code != private_code:
+            return await _emit_event(
+                cmd, "rejected", {"reason": "invalid_code", "action": cmd.action}
+            )
+
+    # Already in this mode (e.g. a client retry): skip the write and publish
+    if new_mode == state.ui_mode:
+        return _noop_event(cmd)
+
+    # Check if switching from private to public while in private app
+    if state.ui_mode == "private" and new_mode == "public":
+        if state.app_route in PRIVATE_APPS:
+            # Navigate to home first
+            state.app_route = "home"
+            patch1 = StatePatch.model_construct(
+                ts=cmd.ts, path="/ui/appRoute", value="home"
+            )
+            await publish_state(patch1.model_dump())
+
+    return await _emit_patch(cmd, "/ui/mode", new_mode)
+
+
+CommandHandler = Callable[[Command], Awaitable[Optional[Event]]]
+
+# Policy table: exact action -> handler
+_HANDLERS: Dict[str, CommandHandler] = {
+    # Common exact spellings of the prefix families below
+    "add_todo": _add_todo,
+    "set_mode": _set_mode,
+    # Device toggles
+    "toggle_mic": lambda cmd: _emit_patch(cmd, "/mic_enabled", not state.mic_enabled),
+    "toggle_cam": lambda cmd: _emit_patch(cmd, "/cam_enabled", not state.cam_enabled),
+    # GN armed state
+    "set_gn_armed": _set_gn_armed,
+    # Global Navigation (GN) commands
+    "nav.nextApp": lambda cmd: _emit_patch(
+        cmd, "/ui/appRoute", _get_next_app(state.app_route, state.ui_mode)
+    ),
+    "nav.prevApp": lambda cmd: _emit_patch(
+        cmd, "/ui/appRoute", _get_prev_app(state.app_route, state.ui_mode)
+    ),
+    # Open the currently focused app (for now, just confirm current app)
+    "nav.openAppFocused": lambda cmd: _emit_patch(cmd, "/ui/focusPath", []),
+    "nav.backOrHome": _nav_back_or_home,
+    # In-App Navigation (IAN) commands; app-specific handling is in the frontend
+    "app.navigate": _app_navigate,
+    # Action spelled out: voice.nav "select" dispatches here with its own cmd
+    "app.selectFocus": lambda cmd: _emit_event(
+        cmd, "accepted", {"action": "app.selectFocus"}
+    ),
+    "app.quickActions": lambda cmd: _emit_event(
+        cmd, "accepted", {"action": cmd.action}
+    ),
+    # Voice commands
+    "voice.openApp": _voice_open_app,
+    "voice.nav": _voice_nav,
+    # System commands
+    "system.toggleDebug": lambda cmd: _emit_patch(
+        cmd, "/ui/debug/enabled", not state.debug_enabled
+    ),
+    "system.setMode": _system_set_mode,
+}
+
+# Policy table: action prefix -> handler, for action families such as
+# gesture_<name>. Keyed by the text before the first "_" so a lookup is one
+# dict probe; the full prefix is still checked with startswith
+_PREFIX_HANDLERS: Dict[str, Tuple[str, CommandHandler]] = {
+    "add": ("add_todo", _add_todo),
+    "set": ("set_mode", _set_mode),
+    "gesture": ("gesture_", _gesture),
+}
 
 
 async def handle_command(cmd: Command) -> Event:
@@ -59,375 +262,45 @@ async def handle_command(cmd: Command) -> Event:
     Arbiter processes commands and generates events.
     Applies policy rules and reduces commands into state patches.
     """
-    print(f"Processing command: {cmd.action} from {cmd.source}")
-
-    # Policy: Add todo
-    if cmd.action.startswith("add_todo"):
-        patch = StatePatch(
-            ts=cmd.ts,
-            path="/todos/+",
-            value={
-                "id": len(state.todos) + 1,
-                "text": cmd.payload.get("text", ""),
-                "completed": False,
-                "created_at": cmd.ts,
-            },
-        )
-        event = Event(
-            id=cmd.id,
-            ts=cmd.ts,
-            commandId=cmd.id,
-            type="state_patch",
-            payload=patch.dict(),
-        )
-
-        # Apply patch locally
-        state.apply_patch(patch.path, patch.value)
-
-        # Persist and broadcast
-        await persist_event(event)
-        await publish_state(patch.dict())
-        return event
-
-    # Policy: Toggle mic
-    elif cmd.action == "toggle_mic":
-        new_state = not state.mic_enabled
-        patch = StatePatch(ts=cmd.ts, path="/mic_enabled", value=new_state)
-        event = Event(
-            id=cmd.id,
-            ts=cmd.ts,
-            commandId=cmd.id,
-            type="state_patch",
-            payload=patch.dict(),
-        )
-
-        state.apply_patch(patch.path, patch.value)
-        await persist_event(event)
-        await publish_state(patch.dict())
-        return event
-
-    # Policy: Toggle camera
-    elif cmd.action == "toggle_cam":
-        new_state = not state.cam_enabled
-        patch = StatePatch(ts=cmd.ts, path="/cam_enabled", value=new_state)
-        event = Event(
-            id=cmd.id,
-            ts=cmd.ts,
-            commandId=cmd.id,
-            type="state_patch",
-            payload=patch.dict(),
-        )
-
-        state.apply_patch(patch.path, patch.value)
-        await persist_event(event)
-        await publish_state(patch.dict())
-        return event
-
-    # Policy: Change mode
-    elif cmd.action.startswith("set_mode"):
-        new_mode = cmd.payload.get("mode", "idle")
-        patch = StatePatch(ts=cmd.ts, path="/mode", value=new_mode)
-        event = Event(
-            id=cmd.id,
-            ts=cmd.ts,
-            commandId=cmd.id,
-            type="state_patch",
-            payload=patch.dict(),
-        )
-
-        state.apply_patch(patch.path, patch.value)
-        await persist_event(event)
-        await publish_state(patch.dict())
-        return event
-
-    # Policy: Gesture update
-    elif cmd.action.startswith("gesture_"):
-        gesture = cmd.payload.get("gesture", "idle")
-        patch = StatePatch(ts=cmd.ts, path="/last_gesture", value=gesture)
-        event = Event(
-            id=cmd.id,
-            ts=cmd.ts,
-            commandId=cmd.id,
-            type="state_patch",
-            payload=patch.dict(),
-        )
-
-        state.apply_patch(patch.path, patch.value)
-        await persist_event(event)
-        await publish_state(patch.dict())
-        return event
-
-    # Policy: Set GN armed state
-    elif cmd.action == "set_gn_armed":
-        gn_armed = cmd.payload.get("gnArmed", False)
-        patch = StatePatch(ts=cmd.ts, path="/ui/gnArmed", value=gn_armed)
-        event = Event(
-            id=cmd.id,
-            ts=cmd.ts,
-            commandId=cmd.id,
-            type="state_patch",
-            payload=patch.dict(),
-        )
-
-        state.apply_patch(patch.path, patch.value)
-        await persist_event(event)
-        await publish_state(patch.dict())
-        return event
-
-    # Policy: Global Navigation (GN) commands
-    elif cmd.action == "nav.nextApp":
-        # Navigate to next app in registry
-        app_route = _get_next_app(state.app_route, state.ui_mode)
-        patch = StatePatch(ts=cmd.ts, path="/ui/appRoute", value=app_route)
-        event = Event(
-            id=cmd.id,
-            ts=cmd.ts,
-            commandId=cmd.id,
-            type="state_patch",
-            payload=patch.dict(),
-        )
-
-        state.apply_patch(patch.path, patch.value)
-        await persist_event(event)
-        await publish_state(patch.dict())
-        return event
-
-    elif cmd.action == "nav.prevApp":
-        # Navigate to previous app in registry
-        app_route = _get_prev_app(state.app_route, state.ui_mode)
-        patch = StatePatch(ts=cmd.ts, path="/ui/appRoute", value=app_route)
-        event = Event(
-            id=cmd.id,
-            ts=cmd.ts,
-            commandId=cmd.id,
-            type="state_patch",
-            payload=patch.dict(),
-        )
-
-        state.apply_patch(patch.path, patch.value)
-        await persist_event(event)
-        await publish_state(patch.dict())
-        return event
-
-    elif cmd.action == "nav.openAppFocused":
-        # Open the currently focused app (if in app rail)
-        # For now, just confirm current app
-        patch = StatePatch(ts=cmd.ts, path="/ui/focusPath", value=[])
-        event = Event(
-            id=cmd.id,
-            ts=cmd.ts,
-            commandId=cmd.id,
-            type="state_patch",
-            payload=patch.dict(),
-        )
-
-        state.apply_patch(patch.path, patch.value)
-        await persist_event(event)
-        await publish_state(patch.dict())
-        return event
-
-    elif cmd.action == "nav.backOrHome":
-        # Navigate back or to home
-        if state.app_route != "home":
-            patch = StatePatch(ts=cmd.ts, path="/ui/appRoute", value="home")
-            event = Event(
-                id=cmd.id,
-                ts=cmd.ts,
-                commandId=cmd.id,
-                type="state_patch",
-                payload=patch.dict(),
-            )
-
-            state.apply_patch(patch.path, patch.value)
-            await persist_event(event)
-            await publish_state(patch.dict())
-            return event
-
-    # Policy: In-App Navigation (IAN) commands
-    elif cmd.action == "app.navigate":
-        direction = cmd.payload.get("direction", "next")
-        # App-specific navigation will be handled by frontend
-        # Just acknowledge the command
-        event = Event(
-            id=cmd.id,
-            ts=cmd.ts,
-            commandId=cmd.id,
-            type="accepted",
-            payload={"action": cmd.action, "direction": direction},
-        )
-        await persist_event(event)
-        return event
-
-    elif cmd.action == "app.selectFocus":
-        # App-specific focus selection will be handled by frontend
-        event = Event(
-            id=cmd.id,
-            ts=cmd.ts,
-            commandId=cmd.id,
-            type="accepted",
-            payload={"action": cmd.action},
-        )
-        await persist_event(event)
-        return event
-
-    elif cmd.action == "app.quickActions":
-        # App-specific quick actions will be handled by frontend
-        event = Event(
-            id=cmd.id,
-            ts=cmd.ts,
-            commandId=cmd.id,
-            type="accepted",
-            payload={"action": cmd.action},
-        )
-        await persist_event(event)
-        return event
-
-    # Policy: Voice commands
-    elif cmd.action == "voice.openApp":
-        app_id = cmd.payload.get("app")
-        if app_id and _is_app_visible(app_id, state.ui_mode):
-            patch = StatePatch(ts=cmd.ts, path="/ui/appRoute", value=app_id)
-            event = Event(
-                id=cmd.id,
-                ts=cmd.ts,
-                commandId=cmd.id,
-                type="state_patch",
-                payload=patch.dict(),
-            )
+    logger.debug("Processing command: %s from %s", cmd.action, cmd.source)
 
-            state.apply_patch(patch.path, patch.value)
-            await persist_event(event)
-            await publish_state(patch.dict())
-            return event
-
-    elif cmd.action == "voice.nav":
-        nav_action = cmd.payload.get("action")
-        # Translate voice nav to appropriate command
-        if nav_action == "next":
-            # Context-aware: GN if in app rail context, else IAN
-            return await handle_command(
-                Command(
-                    id=cmd.id,
-                    ts=cmd.ts,
-                    source="voice",
-                    action="nav.nextApp",
-                    payload={},
-                )
-            )
-        elif nav_action == "prev" or nav_action == "previous":
-            return await handle_command(
-                Command(
-                    id=cmd.id,
-                    ts=cmd.ts,
-                    source="voice",
-                    action="nav.prevApp",
-                    payload={},
-                )
-            )
-        elif nav_action == "back":
-            return await handle_command(
-                Command(
-                    id=cmd.id,
-                    ts=cmd.ts,
-                    source="voice",
-                    action="nav.backOrHome",
-                    payload={},
-                )
-            )
-        elif nav_action == "select":
-            return await handle_command(
-                Command(
-                    id=cmd.id,
-                    ts=cmd.ts,
-                    source="voice",
-                    action="app.selectFocus",
-                    payload={},
-                )
-            )
+    handler = _HANDLERS.get(cmd.action)
+    if handler is None:
+        entry = _PREFIX_HANDLERS.get(cmd.action.partition("_")[0])
+        if entry is not None and cmd.action.startswith(entry[0]):
+            handler = entry[1]
 
-    # Policy: System commands
-    elif cmd.action == "system.toggleDebug":
-        new_state = not state.debug_enabled
-        patch = StatePatch(ts=cmd.ts, path="/ui/debug/enabled", value=new_state)
-        event = Event(
-            id=cmd.id,
-            ts=cmd.ts,
-            commandId=cmd.id,
-            type="state_patch",
-            payload=patch.dict(),
-        )
-
-        state.apply_patch(patch.path, patch.value)
-        await persist_event(event)
-        await publish_state(patch.dict())
-        return event
-
-    elif cmd.action == "system.setMode":
-        new_mode = cmd.payload.get("mode")
-        code = cmd.payload.get("code")
-        private_code = "unlock"  # Should be from env/config
-
-        if new_mode == "private":
-            # Require code
-            if code != private_code:
-                event = Event(
-                    id=cmd.id,
-                    ts=cmd.ts,
-                    commandId=cmd.id,
-                    type="rejected",
-                    payload={"reason": "invalid_code", "action": cmd.action},
-                )
-                await persist_event(event)
-                return event
-
-        # Check if switching from private to public while in private app
-        if state.ui_mode == "private" and new_mode == "public":
-            if state.app_route in ["email", "finance"]:
-                # Navigate to home first
-                state.app_route = "home"
-                patch1 = StatePatch(ts=cmd.ts, path="/ui/appRoute", value="home")
-                await publish_state(patch1.dict())
-
-        patch = StatePatch(ts=cmd.ts, path="/ui/mode", value=new_mode)
-        event = Event(
-            id=cmd.id,
-            ts=cmd.ts,
-            commandId=cmd.id,
-            type="state_patch",
-            payload=patch.dict(),
-        )
-
-        state.apply_patch(patch.path, patch.value)
-        await persist_event(event)
-        await publish_state(patch.dict())
-        return event
+    if handler is not None:
+        return await handler(cmd)
 
     # Unknown command - reject
-    else:
-        event = Event(
-            id=cmd.id,
-            ts=cmd.ts,
-            commandId=cmd.id,
-            type="rejected",
-            payload={"reason": "unknown_action", "action": cmd.action},
-        )
-        await persist_event(event)
-        return event
+    return await _emit_event(
+        cmd, "rejected", {"reason": "unknown_action", "action": cmd.action}
+    )
 
 
 async def persist_event(e: Event):
     """
     Persist an event to SQLite for audit trail and replay.
+    Writes are batched by the background event writer.
     """
     try:
-        async with aiosqlite.connect("data/control_plane.db") as db:
-            await db.execute(
-                "INSERT INTO events VALUES (?,?,?,?,?)",
-                (e.id, e.ts, e.commandId, e.type, json.dumps(e.payload)),
-            )
-            await db.commit()
+        await write_event((e.id, e.ts, e.commandId, e.type, orjson.dumps(e.payload)))
+    except Exception as ex:
+        logger.error("Error persisting event: %s", ex)
+
+
+async def load_snapshot():
+    """
+    Restore state from the latest SQLite snapshot, if one was saved.
+    """
+    try:
+        snapshot = await read_latest_snapshot()
+        if snapshot is not None:
+            state.restore(orjson.loads(snapshot))
+            logger.info("Restored %d todos from snapshot", len(state.todos))
     except Exception as ex:
-        print(f"Error persisting event: {ex}")
+        logger.error("Error loading snapshot: %s", ex)
 
 
 async def save_snapshot():
@@ -435,11 +308,6 @@ async def save_snapshot():
     Periodically save full state snapshot to SQLite.
     """
     try:
-        async with aiosqlite.connect("data/control_plane.db") as db:
-            await db.execute(
-                "INSERT INTO snapshots (ts, state) VALUES (?,?)",
-                (datetime.utcnow().isoformat(), json.dumps(state.to_dict())),
-            )
-            await db.commit()
+        await write_snapshot(utc_now_iso(), orjson.dumps(state.to_dict()))
     except Exception as ex:
-        print(f"Error saving snapshot: {ex}")
+        logger.error("Error saving snapshot: %s", ex)
@@ -10,6 +10,7 @@ DWELL_MS_DEFAULT = 700  # dwell time for focus selection
 
 # Privacy constants
 PRIVACY_IDLE_TIMEOUT_MS = 300000  # 5 min
+PRIVATE_APPS = frozenset({"email", "finance"})  # hidden in public mode
 
 # Wake keyword (for reference - actual processing happens in backend)
 WAKE_KEYWORD = "mira"
@@ -1,5 +1,23 @@
 from typing import Dict, Any, List
-from datetime import datetime
+from ..models.core import utc_iso, utc_now_ms
+
+# Sentinel for "key not present", distinct from a stored None
+_MISSING = object()
+
+# Exact paths of the plain attribute patches the arbiter emits, resolved with
+# one dict lookup instead of splitting the path; anything else is parsed
+_UI_FIELDS = {
+    "/ui/mode": "ui_mode",
+    "/ui/appRoute": "app_route",
+    "/ui/gnArmed": "gn_armed",
+    "/ui/debug/enabled": "debug_enabled",
+}
+_FIELDS = {
+    "/mode": "mode",
+    "/mic_enabled": "mic_enabled",
+    "/cam_enabled": "cam_enabled",
+    "/last_gesture": "last_gesture",
+}
 
 
 class State:
@@ -13,10 +31,12 @@ class State:
         # Legacy mode (kept for backward compatibility)
         self.mode = "idle"  # idle, voice, gesture, settings
         self.todos: List[Dict[str, Any]] = []
+        self.next_todo_id = 1  # never reused, even if todos are removed
         self.mic_enabled = False
         self.cam_enabled = False
         self.last_gesture = "idle"
-        self.last_updated = datetime.utcnow().isoformat()
+        # Kept as an int on every patch; formatted only when state is serialized
+        self.last_updated_ms = utc_now_ms()
 
         # UIState (Phase A & B)
         self.ui_mode = "public"  # "public" | "private"
@@ -38,7 +58,7 @@ class State:
             "mic_enabled": self.mic_enabled,
             "cam_enabled": self.cam_enabled,
             "last_gesture": self.last_gesture,
-            "last_updated": self.last_updated,
+            "last_updated": utc_iso(self.last_updated_ms),
             # UIState
             "ui": {
                 "mode": self.ui_mode,
@@ -50,9 +70,26 @@ class State:
             },
         }
 
-    def apply_patch(self, path: str, value: Any):
+    def restore(self, snapshot: Dict[str, Any]):
+        """
+        Restore todos from a saved snapshot (see to_dict) and seed the id
+        counter past the highest restored id. Device and UI state are live,
+        so they keep their startup defaults.
+        """
+        self.todos = list(snapshot.get("todos") or [])
+        ids = [t["id"] for t in self.todos if isinstance(t.get("id"), int)]
+        self.next_todo_id = max(ids, default=0) + 1
+
+    def allocate_todo_id(self) -> int:
+        """Reserve the next todo id (no await in between, so atomic under asyncio)"""
+        todo_id = self.next_todo_id
+        self.next_todo_id += 1
+        return todo_id
+
+    def apply_patch(self, path: str, value: Any) -> bool:
         """
         Apply a state patch using JSON path notation.
+        Returns whether the state changed (False for a no-op patch).
         Examples:
           /mode -> sets self.mode
           /todos/+ -> appends to self.todos
@@ -61,46 +98,69 @@ class State:
           /ui/appRoute -> sets self.app_route
           /ui/gnArmed -> sets self.gn_armed
         """
+        name = _UI_FIELDS.get(path)
+        if name is not None:
+            return self._set(name, value)
+        name = _FIELDS.get(path)
+        if name is not None:
+            changed = self._set(name, value)
+            self.last_updated_ms = utc_now_ms()
+            return changed
+
         parts = path.strip("/").split("/")
 
         # Handle UI state paths
         if len(parts) >= 2 and parts[0] == "ui":
             if parts[1] == "mode":
-                self.ui_mode = value
+                return self._set("ui_mode", value)
             elif parts[1] == "appRoute":
-                self.app_route = value
+                return self._set("app_route", value)
             elif parts[1] == "focusPath":
-                self.focus_path = value if isinstance(value, list) else []
+                return self._set("focus_path", value if isinstance(value, list) else [])
             elif parts[1] == "gnArmed":
-                self.gn_armed = value
+                return self._set("gn_armed", value)
             elif parts[1] == "debug" and len(parts) >= 3:
                 if parts[2] == "enabled":
-                    self.debug_enabled = value
+                    return self._set("debug_enabled", value)
             elif parts[1] == "hud" and len(parts) >= 3:
-                if parts[2] in self.hud:
+                if parts[2] in self.hud and self.hud[parts[2]] != value:
                     self.hud[parts[2]] = value
-            return
+                    return True
+            return False
+
+        changed = False
 
         # Handle legacy paths
         if len(parts) == 1:
             # Top-level property
             if hasattr(self, parts[0]):
-                setattr(self, parts[0], value)
+                changed = self._set(parts[0], value)
         elif len(parts) == 2 and parts[1] == "+":
             # Array append operation
             if hasattr(self, parts[0]) and isinstance(getattr(self, parts[0]), list):
                 getattr(self, parts[0]).append(value)
+                changed = True
         elif len(parts) == 2:
             # Nested property or array index
             attr = getattr(self, parts[0], None)
             if isinstance(attr, list) and parts[1].isdigit():
                 idx = int(parts[1])
-                if 0 <= idx < len(attr):
+                if 0 <= idx < len(attr) and attr[idx] != value:
                     attr[idx] = value
-            elif isinstance(attr, dict):
+                    changed = True
+            elif isinstance(attr, dict) and attr.get(parts[1], _MISSING) != value:
                 attr[parts[1]] = value
+                changed = True
+
+        self.last_updated_ms = utc_now_ms()
+        return changed
 
-        self.last_updated = datetime.utcnow().isoformat()
+    def _set(self, name: str, value: Any) -> bool:
+        """Set an attribute, returning whether its value changed"""
+        if getattr(self, name) == value:
+            return False
+        setattr(self, name, value)
+        return True
 
 
 # Global state instance
@@ -1,38 +1,91 @@
 import asyncio
+import logging
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from typing import Set
+from typing import List, Optional, Set
 
 from app.workers.gesture import gesture_worker
 from app.workers.voice import voice_worker
-from app.services.bus import subscribe
-from app.services.db import init_db
+from app.services.bus import close_bus, subscribe
+from app.services.db import init_db, start_event_writer, stop_event_writer
 from app.models.core import Command
-from app.core.arbiter import handle_command, save_snapshot
+from app.core.arbiter import handle_command, load_snapshot, save_snapshot
 from app.core.state import state
+from app.util.log import setup_logging, shutdown_logging
 
+logger = logging.getLogger(__name__)
 
 # WebSocket clients registry
 clients: Set[WebSocket] = set()
 
+# Patches are buffered and flushed FLUSH_DELAY seconds after the first one
+# arrives (or as soon as MAX_PENDING are waiting), so a burst goes out as one
+# frame per client instead of one frame per patch. MAX_PENDING matches the
+# backend state socket's MAX_BATCH, so both sockets cap frames at the same size
+FLUSH_DELAY = 0.025
+MAX_PENDING = 64
 
-async def broadcast_to_clients(patch: dict):
+_pending: List[dict] = []
+_flush_task: Optional[asyncio.Task] = None
+
+
+async def _flush_pending():
     """
-    Forward state patches from Redis to all connected WebSocket clients.
+    Send all buffered patches to every connected WebSocket client.
+    A single patch is sent bare, a burst as a JSON array.
     """
+    if not _pending:
+        return
+    # Encoded once for every client rather than by send_json per client
+    payload = orjson.dumps(_pending[0] if len(_pending) == 1 else _pending).decode()
+    _pending.clear()
+
+    # Send to all clients concurrently so one slow socket doesn't delay the rest
+    targets = list(clients)
+    results = await asyncio.gather(
+        *(client.send_text(payload) for client in targets), return_exceptions=True
+    )
     disconnected = set()
-    for client in clients:
-        try:
-            await client.send_json(patch)
-        except Exception as e:
-            print(f"Error broadcasting to client: {e}")
+    for client, result in zip(targets, results):
+        if isinstance(result, Exception):
+            logger.debug("Error broadcasting to client: %s", result)
             disconnected.add(client)
 
     # Clean up disconnected clients
     clients.difference_update(disconnected)
 
 
+async def _flush_later():
+    global _flush_task
+    await asyncio.sleep(FLUSH_DELAY)
+    # Patches that arrive while this flush is sending start a new timer
+    _flush_task = None
+    await _flush_pending()
+
+
+async def _stop_broadcasts():
+    """Cancel the pending flush timer and send whatever is still buffered."""
+    global _flush_task
+    if _flush_task is not None:
+        _flush_task.cancel()
+        _flush_task = None
+    await _flush_pending()
+
+
+async def broadcast_to_clients(patch: dict):
+    """
+    Forward state patches from Redis to all connected WebSocket clients.
+    """
+    global _flush_task
+    _pending.append(patch)
+    if len(_pending) >= MAX_PENDING:
+        await _flush_pending()
+    elif _flush_task is None:
+        _flush_task = asyncio.create_task(_flush_later())
+
+
 async def redis_subscriber():
     """
     Background task that subscribes to Redis and forwards to WebSocket clients.
@@ -55,23 +108,30 @@ async def lifespan(app: FastAPI):
     Startup and shutdown lifecycle management.
     """
     # Startup
-    print("🚀 Control Plane starting up...")
+    setup_logging()
+    logger.info("Control Plane starting up...")
 
     # Initialize database
     await init_db()
-    print("✅ Database initialized")
+    await load_snapshot()
+    await start_event_writer()
+    logger.info("Database initialized")
 
     # Start background workers
     asyncio.create_task(gesture_worker())
     asyncio.create_task(voice_worker())
     asyncio.create_task(redis_subscriber())
     asyncio.create_task(snapshot_saver())
-    print("✅ Background workers started")
+    logger.info("Background workers started")
 
     yield
 
     # Shutdown
-    print("🛑 Control Plane shutting down...")
+    logger.info("Control Plane shutting down...")
+    await _stop_broadcasts()
+    await stop_event_writer()
+    await close_bus()
+    shutdown_logging()
 
 
 # Create FastAPI app
@@ -126,26 +186,28 @@ async def ws_state(websocket: WebSocket):
     await websocket.accept()
     clients.add(websocket)
 
-    print(f"WebSocket client connected. Total clients: {len(clients)}")
+    logger.info("WebSocket client connected. Total clients: %d", len(clients))
 
     try:
-        # Send initial state
-        await websocket.send_json({"type": "initial_state", "data": state.to_dict()})
+        # Send initial state (as text: browser clients JSON.parse the frame)
+        await websocket.send_text(
+            orjson.dumps({"type": "initial_state", "data": state.to_dict()}).decode()
+        )
 
         # Keep connection alive and handle any incoming messages
         while True:
             try:
                 data = await websocket.receive_text()
                 # Could handle client commands here if needed
-                print(f"Received from client: {data}")
+                logger.debug("Received from client: %s", data)
             except WebSocketDisconnect:
                 break
 
     except Exception as e:
-        print(f"WebSocket error: {e}")
+        logger.warning("WebSocket error: %s", e)
     finally:
         clients.discard(websocket)
-        print(f"WebSocket client disconnected. Total clients: {len(clients)}")
+        logger.info("WebSocket client disconnected. Total clients: %d", len(clients))
 
 
 if __name__ == "__main__":
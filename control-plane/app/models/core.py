@@ -1,8 +1,33 @@
 from pydantic import BaseModel, Field
 from typing import Literal, Dict, Any
-from datetime import datetime
+import time
 import uuid
 
+# Second-resolution prefix of the last timestamp; patches and commands arrive
+# many times per second, so only the milliseconds change between most calls
+_iso_second = -1
+_iso_prefix = ""
+
+
+def utc_now_ms() -> int:
+    """Current UTC time in whole milliseconds since the epoch"""
+    return time.time_ns() // 1_000_000
+
+
+def utc_iso(ms: int) -> str:
+    """Format epoch milliseconds as an ISO 8601 UTC string"""
+    global _iso_second, _iso_prefix
+    second, millis = divmod(ms, 1000)
+    if second != _iso_second:
+        _iso_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _iso_second = second
+    return "%s.%03d+00:00" % (_iso_prefix, millis)
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string with millisecond precision"""
+    return utc_iso(utc_now_ms())
+
 
 class Command(BaseModel):
     """
@@ -11,7 +36,7 @@ class Command(BaseModel):
     """
 
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    ts: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    ts: str = Field(default_factory=utc_now_iso)
     source: Literal["voice", "gesture", "system"]
     action: str
     payload: Dict[str, Any] = {}
@@ -1,4 +1,21 @@
-from .db import init_db
-from .bus import publish_state, subscribe
+from .db import (
+    init_db,
+    read_latest_snapshot,
+    start_event_writer,
+    stop_event_writer,
+    write_event,
+    write_snapshot,
+)
+from .bus import close_bus, publish_state, subscribe
 
-__all__ = ["init_db", "publish_state", "subscribe"]
+__all__ = [
+    "init_db",
+    "read_latest_snapshot",
+    "start_event_writer",
+    "stop_event_writer",
+    "write_event",
+    "write_snapshot",
+    "close_bus",
+    "publish_state",
+    "subscribe",
+]
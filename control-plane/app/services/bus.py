@@ -1,10 +1,43 @@
 import redis.asyncio as aioredis
-import json
+from redis.backoff import ExponentialBackoff
+import orjson
 import asyncio
+import logging
 import os
+from typing import Optional
+
+logger = logging.getLogger(__name__)
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 CHANNEL = "mira:state"
+MAX_CONNECTIONS = 16
+
+# Delay before subscriber reconnect attempts: 0.1s doubling up to 10s, so a
+# transient blip recovers quickly without hammering a Redis that is down
+RECONNECT_BACKOFF = ExponentialBackoff(cap=10.0, base=0.1)
+
+# Pooled client shared by every publish and the subscriber, so a publish is
+# one PUBLISH on a kept-alive connection (lazy initialization, closed on shutdown)
+_redis: Optional[aioredis.Redis] = None
+
+
+def _get_redis() -> aioredis.Redis:
+    """Get or create the pooled Redis client"""
+    global _redis
+    if _redis is None:
+        pool = aioredis.ConnectionPool.from_url(
+            REDIS_URL, decode_responses=True, max_connections=MAX_CONNECTIONS
+        )
+        _redis = aioredis.Redis(connection_pool=pool)
+    return _redis
+
+
+async def close_bus():
+    """Disconnect the pooled Redis connections"""
+    global _redis
+    if _redis is not None:
+        client, _redis = _redis, None
+        await client.connection_pool.disconnect()
 
 
 async def publish_state(patch: dict):
@@ -12,36 +45,48 @@ async def publish_state(patch: dict):
     Publish a state patch to Redis for broadcast to all subscribers.
     """
     try:
-        r = await aioredis.from_url(REDIS_URL, decode_responses=True)
-        await r.publish(CHANNEL, json.dumps(patch))
-        await r.close()
+        await _get_redis().publish(CHANNEL, orjson.dumps(patch))
     except Exception as e:
-        print(f"Error publishing to Redis: {e}")
+        logger.error("Error publishing to Redis: %s", e)
 
 
 async def subscribe(callback):
     """
     Subscribe to state patches from Redis and invoke callback for each message.
-    This is a blocking call that should run in a background task.
+    This is a blocking call that should run in a background task; it
+    reconnects on its own if Redis goes away.
     """
-    try:
-        r = await aioredis.from_url(REDIS_URL, decode_responses=True)
-        pubsub = r.pubsub()
-        await pubsub.subscribe(CHANNEL)
-
-        print(f"Subscribed to Redis channel: {CHANNEL}")
-
-        async for msg in pubsub.listen():
-            if msg["type"] == "message":
-                try:
-                    data = json.loads(msg["data"])
-                    await callback(data)
-                except json.JSONDecodeError as e:
-                    print(f"Error decoding message: {e}")
-                except Exception as e:
-                    print(f"Error in callback: {e}")
-    except Exception as e:
-        print(f"Error subscribing to Redis: {e}")
-        # Retry after delay
-        await asyncio.sleep(5)
-        await subscribe(callback)
+    failures = 0
+
+    while True:
+        pubsub = _get_redis().pubsub()
+        try:
+            await pubsub.subscribe(CHANNEL)
+
+            logger.info("Subscribed to Redis channel: %s", CHANNEL)
+            failures = 0
+
+            async for msg in pubsub.listen():
+                if msg["type"] == "message":
+                    try:
+                        data = orjson.loads(msg["data"])
+                        await callback(data)
+                    except orjson.JSONDecodeError as e:
+                        logger.warning("Error decoding message: %s", e)
+                    except Exception as e:
+                        logger.error("Error in callback: %s", e)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Error subscribing to Redis: %s", e)
+        finally:
+            # Hand the connection back to the shared pool before retrying,
+            # so a flapping Redis can't starve publish_state
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+
+        # Retry after a backoff that grows with consecutive failures
+        await asyncio.sleep(RECONNECT_BACKOFF.compute(failures))
+        failures += 1
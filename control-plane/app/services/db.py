@@ -1,14 +1,39 @@
+import asyncio
 import aiosqlite
+import logging
 import os
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 DB_PATH = "data/control_plane.db"
 
+INSERT_EVENT = (
+    "INSERT INTO events (id, ts, commandId, type, payload) VALUES (?,?,?,?,?)"
+)
+INSERT_SNAPSHOT = "INSERT INTO snapshots (ts, state) VALUES (?,?)"
+SELECT_LATEST_SNAPSHOT = "SELECT state FROM snapshots ORDER BY id DESC LIMIT 1"
+
+# Most events written per transaction by the background writer
+MAX_EVENT_BATCH = 256
+
+# How long the writer lingers after the first queued event (seconds), so a
+# steady trickle of events (e.g. gesture ticks) shares a commit as well
+EVENT_FLUSH_DELAY = 0.05
+
+# Shared connection and background event writer (started from the app lifespan)
+_event_queue: Optional[asyncio.Queue] = None
+_event_writer: Optional[asyncio.Task] = None
+_db: Optional[aiosqlite.Connection] = None
+
 
 async def init_db():
     """
     Initialize SQLite database with events and snapshots tables.
     Events store all command outcomes for audit/replay.
     Snapshots store periodic full state for efficient recovery.
+    Event payloads and snapshot states are UTF-8 JSON stored as BLOBs
+    (rows from older databases may still be TEXT).
     """
     # Ensure data directory exists
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
@@ -21,13 +46,13 @@ async def init_db():
           ts TEXT NOT NULL,
           commandId TEXT NOT NULL,
           type TEXT NOT NULL,
-          payload TEXT NOT NULL
+          payload BLOB NOT NULL
         );
         
         CREATE TABLE IF NOT EXISTS snapshots (
           id INTEGER PRIMARY KEY AUTOINCREMENT,
           ts TEXT NOT NULL,
-          state TEXT NOT NULL
+          state BLOB NOT NULL
         );
         
         CREATE INDEX IF NOT EXISTS idx_events_ts ON events(ts);
@@ -36,3 +61,116 @@ async def init_db():
         """
         )
         await db.commit()
+
+
+async def _write_event_batches(db: aiosqlite.Connection, queue: asyncio.Queue):
+    """
+    Drain queued events into SQLite, committing everything queued within
+    EVENT_FLUSH_DELAY in one transaction instead of one commit per event.
+    Returns after writing the events queued ahead of a None sentinel.
+    """
+    while True:
+        row = await queue.get()
+        if row is None:
+            return
+        await asyncio.sleep(EVENT_FLUSH_DELAY)
+
+        batch = [row]
+        stop = False
+        while len(batch) < MAX_EVENT_BATCH and not queue.empty():
+            row = queue.get_nowait()
+            if row is None:
+                stop = True
+                break
+            batch.append(row)
+        try:
+            await db.executemany(INSERT_EVENT, batch)
+            await db.commit()
+        except Exception as ex:
+            logger.error("Error persisting events: %s", ex)
+        if stop:
+            return
+
+
+async def start_event_writer():
+    """
+    Open the process-wide connection and start the batching event writer.
+    """
+    global _event_queue, _event_writer, _db
+    if _event_writer is not None:
+        return
+
+    _db = await aiosqlite.connect(DB_PATH)
+    # WAL lets commits append to the log instead of rewriting pages, and
+    # NORMAL only fsyncs at checkpoints; an OS crash can lose the last
+    # few events but never corrupts the database
+    await _db.execute("PRAGMA journal_mode=WAL")
+    await _db.execute("PRAGMA synchronous=NORMAL")
+
+    _event_queue = asyncio.Queue()
+    _event_writer = asyncio.create_task(_write_event_batches(_db, _event_queue))
+
+
+async def stop_event_writer():
+    """
+    Stop the writer, flush events still queued, and close the connection.
+    """
+    global _event_queue, _event_writer, _db
+    if _event_writer is None:
+        return
+
+    # Let the writer finish what is queued, then pick up any stragglers
+    # queued behind the sentinel
+    _event_queue.put_nowait(None)
+    await _event_writer
+
+    remaining = []
+    while not _event_queue.empty():
+        remaining.append(_event_queue.get_nowait())
+    if remaining:
+        await _db.executemany(INSERT_EVENT, remaining)
+        await _db.commit()
+    await _db.close()
+
+    _event_queue = _event_writer = _db = None
+
+
+async def write_event(row: Tuple[str, str, str, str, bytes]):
+    """
+    Persist one events row. Queued for the batching writer when it is
+    running, otherwise written directly (e.g. in tests and scripts).
+    """
+    if _event_queue is not None:
+        _event_queue.put_nowait(row)
+        return
+
+    async with aiosqlite.connect(DB_PATH) as db:
+        await db.execute(INSERT_EVENT, row)
+        await db.commit()
+
+
+async def write_snapshot(ts: str, state_json: bytes):
+    """
+    Persist one state snapshot, on the shared connection when it is open.
+    """
+    if _db is not None:
+        await _db.execute(INSERT_SNAPSHOT, (ts, state_json))
+        await _db.commit()
+        return
+
+    async with aiosqlite.connect(DB_PATH) as db:
+        await db.execute(INSERT_SNAPSHOT, (ts, state_json))
+        await db.commit()
+
+
+async def read_latest_snapshot() -> Optional[bytes]:
+    """
+    Return the most recent snapshot's state JSON, or None if there is none.
+    """
+    async with aiosqlite.connect(DB_PATH) as db:
+        async with db.execute(SELECT_LATEST_SNAPSHOT) as cursor:
+            row = await cursor.fetchone()
+    if row is None:
+        return None
+    # Older databases stored the state as TEXT
+    return row[0].encode() if isinstance(row[0], str) else row[0]
@@ -0,0 +1,55 @@
+"""
+Logging setup - non-blocking log output for the control plane.
+
+Application loggers (everything under "app", e.g. logging.getLogger(__name__))
+enqueue records through a QueueHandler; a background QueueListener thread does
+the actual formatting and stream writes, so the event loop never blocks on
+log I/O.
+
+Usage:
+    import logging
+
+    logger = logging.getLogger(__name__)
+    logger.info("Subscribed to Redis channel: %s", CHANNEL)
+"""
+
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging():
+    """Route the "app" logger hierarchy through a queue to stdout"""
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(LOG_LEVEL)
+    app_logger.handlers.clear()
+    app_logger.addHandler(QueueHandler(log_queue))
+    app_logger.propagate = False
+
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,11 +1,17 @@
 import asyncio
+import logging
 import random
 from ..models.core import Command
 from ..core.arbiter import handle_command
 
+logger = logging.getLogger(__name__)
+
 
 GESTURES = ["idle", "palm", "swipe_left", "swipe_right", "fist"]
 
+# Cumulative pick weights (idle is more common), accumulated once up front
+GESTURE_CUM_WEIGHTS = (0.6, 0.7, 0.8, 0.9, 1.0)
+
 
 async def gesture_worker():
     """
@@ -13,7 +19,7 @@ async def gesture_worker():
     In production, this would interface with actual gesture recognition hardware/software.
     Emits gesture commands every 3-5 seconds.
     """
-    print("Gesture worker started")
+    logger.info("Gesture worker started")
 
     while True:
         try:
@@ -21,8 +27,7 @@ async def gesture_worker():
             await asyncio.sleep(random.uniform(3, 5))
 
             # Pick random gesture (mostly idle, sometimes action)
-            weights = [0.6, 0.1, 0.1, 0.1, 0.1]  # idle is more common
-            g = random.choices(GESTURES, weights=weights)[0]
+            g = random.choices(GESTURES, cum_weights=GESTURE_CUM_WEIGHTS)[0]
 
             cmd = Command(
                 source="gesture",
@@ -31,8 +36,8 @@ async def gesture_worker():
             )
 
             await handle_command(cmd)
-            print(f"Gesture worker: emitted {g}")
+            logger.info("Gesture worker: emitted %s", g)
 
         except Exception as e:
-            print(f"Error in gesture worker: {e}")
+            logger.error("Error in gesture worker: %s", e)
             await asyncio.sleep(5)
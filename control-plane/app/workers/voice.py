@@ -1,8 +1,11 @@
 import asyncio
+import logging
 import random
 from ..models.core import Command
 from ..core.arbiter import handle_command
 
+logger = logging.getLogger(__name__)
+
 
 VOICE_COMMANDS = [
     ("add_todo", {"text": "Buy groceries"}),
@@ -21,7 +24,7 @@ async def voice_worker():
     In production, this would interface with hotword detection and speech-to-text.
     Emits voice commands every 8-15 seconds.
     """
-    print("Voice worker started")
+    logger.info("Voice worker started")
 
     while True:
         try:
@@ -34,8 +37,8 @@ async def voice_worker():
             cmd = Command(source="voice", action=action, payload=payload)
 
             await handle_command(cmd)
-            print(f"Voice worker: emitted {action}")
+            logger.info("Voice worker: emitted %s", action)
 
         except Exception as e:
-            print(f"Error in voice worker: {e}")
+            logger.error("Error in voice worker: %s", e)
             await asyncio.sleep(5)
@@ -1,7 +1,8 @@
 import pytest
 import asyncio
 from app.models.core import Command
-from app.core.arbiter import handle_command
+from app.core.arbiter import handle_command, load_snapshot, save_snapshot
+from app.core.state import state
 from app.services.db import init_db
 
 
@@ -25,6 +26,19 @@ async def test_add_todo_command(setup_db):
     assert event.payload["path"] == "/todos/+"
 
 
+@pytest.mark.asyncio
+async def test_add_todo_ids_are_unique(setup_db):
+    """Test that consecutive add_todo commands get distinct, increasing ids."""
+    first = await handle_command(
+        Command(source="voice", action="add_todo", payload={"text": "One"})
+    )
+    second = await handle_command(
+        Command(source="voice", action="add_todo", payload={"text": "Two"})
+    )
+
+    assert second.payload["value"]["id"] == first.payload["value"]["id"] + 1
+
+
 @pytest.mark.asyncio
 async def test_toggle_mic_command(setup_db):
     """Test that toggle_mic command generates state_patch event."""
@@ -45,3 +59,37 @@ async def test_unknown_command_rejected(setup_db):
 
     assert event.type == "rejected"
     assert event.payload["reason"] == "unknown_action"
+
+
+@pytest.mark.asyncio
+async def test_set_mode_unchanged_is_noop(setup_db):
+    """Test that setting the current UI mode again is accepted as a no-op."""
+    from app.core.state import state
+
+    cmd = Command(
+        source="system", action="system.setMode", payload={"mode": state.ui_mode}
+    )
+
+    event = await handle_command(cmd)
+
+    assert event.type == "accepted"
+    assert event.payload["noop"] is True
+
+
+@pytest.mark.asyncio
+async def test_todo_ids_continue_after_restore(setup_db):
+    """Test that a restart restoring the latest snapshot doesn't reuse ids."""
+    first = await handle_command(
+        Command(source="voice", action="add_todo", payload={"text": "One"})
+    )
+    await save_snapshot()
+
+    # Simulate a restart
+    state.todos = []
+    state.next_todo_id = 1
+    await load_snapshot()
+
+    second = await handle_command(
+        Command(source="voice", action="add_todo", payload={"text": "Two"})
+    )
+    assert second.payload["value"]["id"] > first.payload["value"]["id"]
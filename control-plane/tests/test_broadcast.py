@@ -0,0 +1,54 @@
+import asyncio
+
+import orjson
+import pytest
+
+from app import main
+
+
+class FakeClient:
+    """Records text frames sent to it."""
+
+    def __init__(self):
+        self.frames = []
+
+    async def send_text(self, text):
+        self.frames.append(orjson.loads(text))
+
+
+@pytest.fixture
+def client():
+    fake = FakeClient()
+    main.clients.add(fake)
+    yield fake
+    main.clients.discard(fake)
+
+
+@pytest.mark.asyncio
+async def test_single_patch_sent_bare(client):
+    """Test that a lone patch is flushed as a bare object."""
+    await main.broadcast_to_clients({"path": "/mode", "value": "voice"})
+    await asyncio.sleep(main.FLUSH_DELAY * 2)
+
+    assert client.frames == [{"path": "/mode", "value": "voice"}]
+
+
+@pytest.mark.asyncio
+async def test_burst_sent_as_one_array(client):
+    """Test that patches within the flush window share one array frame."""
+    for i in range(3):
+        await main.broadcast_to_clients({"path": "/mode", "value": i})
+    await asyncio.sleep(main.FLUSH_DELAY * 2)
+
+    assert client.frames == [[{"path": "/mode", "value": i} for i in range(3)]]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_flushes_pending_patches(client):
+    """Test that stopping broadcasts sends what is buffered and clears the timer."""
+    await main.broadcast_to_clients({"path": "/mode", "value": "idle"})
+
+    await main._stop_broadcasts()
+
+    assert client.frames == [{"path": "/mode", "value": "idle"}]
+    assert main._flush_task is None
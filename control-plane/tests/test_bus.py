@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from app.services import bus
+
+
+class FlakyPubSub:
+    """PubSub whose subscribe always fails."""
+
+    def __init__(self, opened):
+        self.closed = False
+        opened.append(self)
+
+    async def subscribe(self, channel):
+        raise ConnectionError("redis down")
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeRedis:
+    def __init__(self):
+        self.opened = []
+
+    def pubsub(self):
+        return FlakyPubSub(self.opened)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_closes_pubsub_before_retrying(monkeypatch):
+    """Test that failed subscriptions release their connection and back off."""
+    fake = FakeRedis()
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+        if len(delays) == 3:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(bus, "_get_redis", lambda: fake)
+    monkeypatch.setattr(bus.asyncio, "sleep", fake_sleep)
+
+    with pytest.raises(asyncio.CancelledError):
+        await bus.subscribe(lambda data: None)
+
+    assert len(fake.opened) == 3
+    assert all(p.closed for p in fake.opened)
+    assert delays == sorted(delays) and delays[0] < delays[-1]
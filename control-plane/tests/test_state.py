@@ -46,3 +46,31 @@ def test_state_to_dict():
     assert d["mode"] == "gesture"
     assert d["mic_enabled"] == True
     assert "last_updated" in d
+
+
+def test_state_apply_patch_reports_change():
+    """Test that apply_patch reports whether the state changed."""
+    s = State()
+
+    assert s.apply_patch("/ui/mode", "private") is True
+    assert s.apply_patch("/ui/mode", "private") is False
+    assert s.apply_patch("/mic_enabled", False) is False
+    assert s.apply_patch("/todos/+", {"id": 1}) is True
+
+
+def test_state_restore_seeds_todo_ids():
+    """Test that restoring a snapshot continues ids past the highest one."""
+    s = State()
+    s.restore({"todos": [{"id": 3, "text": "a"}, {"id": 7, "text": "b"}]})
+
+    assert [t["id"] for t in s.todos] == [3, 7]
+    assert s.allocate_todo_id() == 8
+
+
+def test_state_restore_empty_snapshot():
+    """Test that a snapshot without todos starts the counter at 1."""
+    s = State()
+    s.restore({})
+
+    assert s.todos == []
+    assert s.allocate_todo_id() == 1
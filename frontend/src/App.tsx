@@ -381,8 +381,10 @@ function App() {
 
         ws.onmessage = (event) => {
           try {
-            const patch: StatePatch = JSON.parse(event.data);
-            applyStatePatch(patch);
+            // Bursts of patches arrive batched as a JSON array
+            const data: StatePatch | StatePatch[] = JSON.parse(event.data);
+            const patches = Array.isArray(data) ? data : [data];
+            patches.forEach(applyStatePatch);
           } catch (error) {
             console.error('Failed to parse state patch:', error);
           }
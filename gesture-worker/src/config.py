@@ -23,7 +23,10 @@ SHOW_PREVIEW_WINDOW = os.getenv("SHOW_PREVIEW_WINDOW", "false").lower() == "true
 # Redis channels and keys
 PUBLISH_REDIS = os.getenv("PUBLISH_REDIS", "true").lower() == "true"
 VISION_CHANNEL = "mira:vision"  # Redis channel for raw vision data
-SNAPSHOT_KEY = "mira:vision:snapshot"  # Redis key for latest frame snapshot
+SNAPSHOT_KEY = "mira:vision:snapshot"  # Redis key for latest frame snapshot (raw JPEG)
+SNAPSHOT_VERSION_KEY = (
+    "mira:vision:snapshot:version"  # Counter bumped per snapshot (ETag)
+)
 
 # MediaPipe configuration
 MEDIAPIPE_MODEL_COMPLEXITY = 1
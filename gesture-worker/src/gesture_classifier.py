@@ -2,12 +2,12 @@
 Gesture classification module - detects static gestures, swipes, and computes GN armed state.
 """
 
+import logging
+import math
 from collections import deque
 from .logger import get_logger
 from typing import Deque, Dict, Optional, Tuple
 
-import numpy as np
-
 from .config import (
     GN_HYSTERESIS_MS,
     GN_STEADY_MS,
@@ -20,19 +20,33 @@ from .config import (
 # Logger
 logger = get_logger()
 
+# Pinch test compares squared distances, so the threshold is squared once
+_PINCH_THRESHOLD_SQ = PINCH_THRESHOLD * PINCH_THRESHOLD
+
 
 def compute_centroid(landmarks) -> Tuple[float, float]:
     """Compute normalized (x, y) centroid of hand"""
-    xs = [lm.x for lm in landmarks.landmark]
-    ys = [lm.y for lm in landmarks.landmark]
-    return float(np.mean(xs)), float(np.mean(ys))
+    # One pass of plain float sums; np.mean would first copy each coordinate
+    # list into an array, which costs more than summing 21 points
+    points = landmarks.landmark
+    sx = sy = 0.0
+    for lm in points:
+        sx += lm.x
+        sy += lm.y
+    n = len(points)
+    return sx / n, sy / n
 
 
 def compute_distance(p1, p2) -> float:
     """Compute normalized distance between two points"""
+    return math.sqrt(compute_distance_sq(p1, p2))
+
+
+def compute_distance_sq(p1, p2) -> float:
+    """Compute squared normalized distance (for threshold checks, no sqrt)"""
     dx = p1.x - p2.x
     dy = p1.y - p2.y
-    return np.sqrt(dx * dx + dy * dy)
+    return dx * dx + dy * dy
 
 
 def classify_static_gesture(landmarks) -> str:
@@ -40,35 +54,39 @@ def classify_static_gesture(landmarks) -> str:
     Classify static hand gestures based on finger extension.
     Returns: 'open', 'fist', 'pinch', 'twoFinger', or 'unknown'
     """
-    # Get landmark positions (normalized 0-1)
+    # Get landmark positions (normalized 0-1). Each coordinate is read once
+    # into a local float: every protobuf access crosses into C, and the
+    # checks and log lines below would otherwise repeat those reads
+    points = landmarks.landmark
+
     # Index finger
-    idx_tip = landmarks.landmark[8]
-    idx_pip = landmarks.landmark[6]
-    idx_mcp = landmarks.landmark[5]
+    idx_tip = points[8]
+    idx_tip_y = idx_tip.y
+    idx_pip_y = points[6].y
 
     # Middle finger
-    mid_tip = landmarks.landmark[12]
-    mid_pip = landmarks.landmark[10]
-    mid_mcp = landmarks.landmark[9]
+    mid_tip_y = points[12].y
+    mid_pip_y = points[10].y
 
     # Ring finger
-    ring_tip = landmarks.landmark[16]
-    ring_pip = landmarks.landmark[14]
+    ring_tip_y = points[16].y
+    ring_pip_y = points[14].y
 
     # Pinky finger
-    pinky_tip = landmarks.landmark[20]
-    pinky_pip = landmarks.landmark[18]
+    pinky_tip_y = points[20].y
+    pinky_pip_y = points[18].y
 
     # Thumb
-    thumb_tip = landmarks.landmark[4]
-    thumb_ip = landmarks.landmark[3]
+    thumb_tip = points[4]
+    thumb_tip_x = thumb_tip.x
+    thumb_ip_x = points[3].x
 
     # Check if fingers are extended (tip above pip in image coords)
-    idx_extended = idx_tip.y < idx_pip.y
-    mid_extended = mid_tip.y < mid_pip.y
-    ring_extended = ring_tip.y < ring_pip.y
-    pinky_extended = pinky_tip.y < pinky_pip.y
-    thumb_extended = abs(thumb_tip.x - thumb_ip.x) > 0.1
+    idx_extended = idx_tip_y < idx_pip_y
+    mid_extended = mid_tip_y < mid_pip_y
+    ring_extended = ring_tip_y < ring_pip_y
+    pinky_extended = pinky_tip_y < pinky_pip_y
+    thumb_extended = abs(thumb_tip_x - thumb_ip_x) > 0.1
 
     fingers_extended = [
         idx_extended,
@@ -77,31 +95,36 @@ def classify_static_gesture(landmarks) -> str:
         pinky_extended,
     ]
 
-    logger.info(
-        f"index finger - extended: {idx_extended}; idx_tip.y: {idx_tip.y}; idx_pip.y: {idx_pip.y}"
+    # Per-frame detail (~30 FPS): only build the messages when DEBUG is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"index finger - extended: {idx_extended}; idx_tip.y: {idx_tip_y}; idx_pip.y: {idx_pip_y}"
+        )
+        logger.debug(
+            f"middle finger - extended: {mid_extended}; mid_tip.y: {mid_tip_y}; mid_pip.y: {mid_pip_y}"
+        )
+        logger.debug(
+            f"ring finger - extended: {ring_extended}; ring_tip.y: {ring_tip_y}; ring_pip.y: {ring_pip_y}"
+        )
+        logger.debug(
+            f"pinky finger - extended: {pinky_extended}; pinky_tip.y: {pinky_tip_y}; pinky_pip.y: {pinky_pip_y}"
+        )
+        logger.debug(
+            f"thumb - extended: {thumb_extended}; thumb_tip.x: {thumb_tip_x}; thumb_ip.x: {thumb_ip_x}"
+        )
+
+    # Check for pinch (thumb and index tip close together); a pinch only
+    # counts with the index curled, so the distance is skipped otherwise
+    is_pinch = (
+        not idx_extended
+        and compute_distance_sq(thumb_tip, idx_tip) < _PINCH_THRESHOLD_SQ
     )
-    logger.info(
-        f"middle finger - extended: {mid_extended}; mid_tip.y: {mid_tip.y}; mid_pip.y: {mid_pip.y}"
-    )
-    logger.info(
-        f"ring finger - extended: {ring_extended}; ring_tip.y: {ring_tip.y}; ring_pip.y: {ring_pip.y}"
-    )
-    logger.info(
-        f"pinky finger - extended: {pinky_extended}; pinky_tip.y: {pinky_tip.y}; pinky_pip.y: {pinky_pip.y}"
-    )
-    logger.info(
-        f"thumb - extended: {thumb_extended}; thumb_tip.x: {thumb_tip.x}; thumb_ip.x: {thumb_ip.x}"
-    )
-
-    # Check for pinch (thumb and index tip close together)
-    pinch_distance = compute_distance(thumb_tip, idx_tip)
-    is_pinch = pinch_distance < PINCH_THRESHOLD
 
     # Check for two-finger (index and middle extended, others closed)
     is_two_finger = idx_extended and mid_extended and not any(fingers_extended[2:])
 
     # Classify
-    if is_pinch and not idx_extended:
+    if is_pinch:
         return "pinch"
     elif is_two_finger:
         return "twoFinger"
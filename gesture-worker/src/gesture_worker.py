@@ -112,6 +112,7 @@ class GestureWorker:
         gesture = "idle"
         confidence = 0.0
         hands_data = {}
+        centroids: Dict[str, Tuple[float, float]] = {}
 
         if results.multi_hand_landmarks:
             # Process all detected hands
@@ -133,6 +134,7 @@ class GestureWorker:
 
                 # Compute centroid and velocity
                 centroid = compute_centroid(hand_landmarks)
+                centroids[hand_id] = centroid
                 tracker.update_velocity(centroid, current_time)
 
                 # Get hand state
@@ -181,15 +183,9 @@ class GestureWorker:
                 confidence = 0.85 if gesture != "idle" else 0.95
 
                 # Track centroid from active hand for swipe detection
-                for hand_idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-                    hand_label = (
-                        results.multi_handedness[hand_idx].classification[0].label
-                    )
-                    if hand_label.lower() == active_hand_id:
-                        centroid = compute_centroid(hand_landmarks)
-                        cx, _ = centroid
-                        self.centroid_buffer.append((current_time, cx))
-                        break
+                # (reusing the one computed above rather than recomputing it)
+                cx, _ = centroids[active_hand_id]
+                self.centroid_buffer.append((current_time, cx))
 
             # Detect dynamic gestures (swipes) - always check
             swipe = detect_swipe(self.centroid_buffer, current_time)
@@ -2,11 +2,10 @@
 Hand tracking module - tracks individual hand state, pose, velocity, and steady time.
 """
 
+import math
 from collections import deque
 from typing import Deque, Dict, Tuple
 
-import numpy as np
-
 
 class HandTracker:
     """Tracks individual hand state: pose, velocity, steadyMs"""
@@ -56,6 +55,6 @@ class HandTracker:
 
         # Use most recent velocity
         _, vx, vy = self.velocity_history[-1]
-        mag = np.sqrt(vx * vx + vy * vy)
+        mag = math.sqrt(vx * vx + vy * vy)
         return {"x": float(vx), "y": float(vy), "mag": float(mag)}
 
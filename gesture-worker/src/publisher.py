@@ -2,8 +2,8 @@
 Publisher module - handles Redis and HTTP publishing for gestures and commands.
 """
 
-import base64
 import json
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import Optional
@@ -18,6 +18,7 @@ from .config import (
     REDIS_URL,
     SNAPSHOT_KEY,
     SNAPSHOT_TTL,
+    SNAPSHOT_VERSION_KEY,
     VISION_CHANNEL,
     PUBLISH_REDIS,
 )
@@ -25,6 +26,26 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Second-resolution prefix of the last intent timestamp; intents are published
+# many times per second, so only the milliseconds change between most calls
+_iso_second = -1
+_iso_prefix = ""
+
+
+def _utc_iso_ms(ms: int) -> str:
+    """
+    Format epoch milliseconds as ISO-8601 UTC with millisecond precision,
+    matching datetime.isoformat(timespec="milliseconds") (same as the
+    control plane's utc_iso). Takes integer milliseconds so float rounding
+    can't drop a millisecond.
+    """
+    global _iso_second, _iso_prefix
+    second, millis = divmod(ms, 1000)
+    if second != _iso_second:
+        _iso_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _iso_second = second
+    return "%s.%03d+00:00" % (_iso_prefix, millis)
+
 
 class Publisher:
     """Handles publishing gestures to Redis and commands to Control Plane"""
@@ -47,25 +68,21 @@ class Publisher:
         if self.http_client:
             await self.http_client.aclose()
 
-    def encode_frame_as_jpeg(self, frame) -> Optional[str]:
-        """Encode frame as base64-encoded JPEG"""
+    def encode_frame_as_jpeg(self, frame) -> Optional[bytes]:
+        """Encode frame as JPEG bytes"""
         try:
-            # Encode frame as JPEG
             success, encoded = cv2.imencode(
                 ".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY]
             )
             if not success:
                 return None
-            # Convert to base64
-            jpeg_bytes = encoded.tobytes()
-            base64_str = base64.b64encode(jpeg_bytes).decode("utf-8")
-            return base64_str
+            return encoded.tobytes()
         except Exception as e:
             logger.error(f"Error encoding frame: {e}")
             return None
 
     async def publish_frame_snapshot(self, frame, current_time: float):
-        """Publish annotated frame as base64 JPEG to Redis (throttled)"""
+        """Publish annotated frame as raw JPEG bytes to Redis (throttled)"""
         if not PUBLISH_REDIS:
             return
 
@@ -73,13 +90,17 @@ class Publisher:
         if current_time - self.last_snapshot_time < self.snapshot_interval:
             return
 
-        base64_jpeg = self.encode_frame_as_jpeg(frame)
-        if not base64_jpeg:
+        jpeg_bytes = self.encode_frame_as_jpeg(frame)
+        if not jpeg_bytes:
             return
 
         try:
-            # Store in Redis with TTL (will be refreshed if worker is alive)
-            await self.redis.set(SNAPSHOT_KEY, base64_jpeg, ex=SNAPSHOT_TTL)
+            # Store in Redis with TTL (will be refreshed if worker is alive) and
+            # bump the version atomically so the backend can serve ETags
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.set(SNAPSHOT_KEY, jpeg_bytes, ex=SNAPSHOT_TTL)
+                pipe.incr(SNAPSHOT_VERSION_KEY)
+                await pipe.execute()
             self.last_snapshot_time = current_time
         except Exception as e:
             logger.error(f"Error publishing frame snapshot: {e}")
@@ -92,7 +113,7 @@ class Publisher:
             return
 
         intent = {
-            "tsISO": datetime.now(timezone.utc).isoformat(),
+            "tsISO": _utc_iso_ms(time.time_ns() // 1_000_000),
             "gesture": gesture,
             "confidence": confidence,
             "armed": gn_armed,  # Keep for backward compatibility
@@ -0,0 +1,36 @@
+"""Tests for the publisher's timestamp formatting."""
+
+import unittest
+from datetime import datetime, timezone
+
+from src.publisher import _utc_iso_ms
+
+
+def _expected(ms: int) -> str:
+    return datetime.fromtimestamp(ms / 1000, timezone.utc).isoformat(
+        timespec="milliseconds"
+    )
+
+
+class TestUtcIsoMs(unittest.TestCase):
+    def test_matches_isoformat(self):
+        """Test the output against datetime.isoformat, +00:00 suffix included."""
+        for ms in (0, 999, 1_000, 1_700_000_000_123, 1_700_000_000_999):
+            with self.subTest(ms=ms):
+                self.assertEqual(_utc_iso_ms(ms), _expected(ms))
+
+    def test_cached_prefix_follows_second_changes(self):
+        """Test that consecutive calls across a second boundary stay correct."""
+        start = 1_700_000_000_990
+        for ms in range(start, start + 30):
+            self.assertEqual(_utc_iso_ms(ms), _expected(ms))
+
+    def test_millisecond_suffix(self):
+        """Test the fixed-width millisecond part and UTC offset."""
+        self.assertEqual(
+            _utc_iso_ms(1_700_000_000_007), "2023-11-14T22:13:20.007+00:00"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()